@@ -0,0 +1,101 @@
+"""Load the mock Ergast data into PostgreSQL with PostgresSink and check the result.
+
+Runs against the database in DATABASE_URL (or --dsn), inside a throwaway
+schema that is dropped afterwards. Skipped, with exit status 0, when
+psycopg2 is not installed or no database is configured.
+
+    DATABASE_URL=postgresql://localhost/f1ai python benchmarks/check_postgres_sink.py
+"""
+import os
+import sys
+import uuid
+import argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Check the working tree even when the package is not installed
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+sys.path.insert(0, HERE)
+
+from mock_ergast import MockErgastServer
+
+def count(cursor, table):
+    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+    return cursor.fetchone()[0]
+
+def check(connection, base_url, start_year, end_year):
+    """Load every endpoint twice and assert the second load changes nothing; returns {table: rows}."""
+    from f1ai.collectors import collect_frame
+    from f1ai.drivers_endpoint import DriversDataExtractor
+    from f1ai.constructors_endpoint import ConstructorsDataExtractor
+    from f1ai.race_schedule_endpoint import RaceScheduleDataExtractor
+    from f1ai.postgres_sink import TABLES, PostgresSink
+
+    sink = PostgresSink(connection=connection, batch_rows=25)
+    sink.create_tables()
+    drivers = DriversDataExtractor(base_url)
+    constructors = ConstructorsDataExtractor(base_url)
+    races = RaceScheduleDataExtractor(base_url)
+
+    counts = {}
+    for attempt in range(2):
+        # One path per loader: whole frame, one transaction per season, pages and records
+        sink.load(collect_frame(races.iter_years_pages(start_year, end_year)), 'races')
+        sink.load_by_season(collect_frame(drivers.iter_years_pages(start_year, end_year)), 'drivers')
+        sink.load_pages(constructors.iter_years_pages(start_year, end_year), 'constructors')
+        for season in range(start_year, end_year + 1):
+            endpoint = drivers.year_endpoint.format(year=season, format='json')
+            sink.load_records(drivers.iter_records(endpoint, 'json'), 'drivers', season=season)
+
+        with connection.cursor() as cursor:
+            loaded = {name: count(cursor, TABLES[name]['table']) for name in ['races', 'drivers', 'constructors']}
+        assert all(loaded.values()), f"nothing loaded: {loaded}"
+        # Reloading the same data must upsert in place
+        assert attempt == 0 or loaded == counts, f"reload changed the row counts: {counts} -> {loaded}"
+        counts = loaded
+
+    expected = len(collect_frame(drivers.iter_years_pages(start_year, end_year)).drop_duplicates(['driverId', 'year']))
+    assert counts['drivers'] == expected, f"{counts['drivers']} driver seasons loaded, expected {expected}"
+
+    # Records without their season cannot satisfy the (driver_id, season) key
+    try:
+        sink.load_records(drivers.iter_records(drivers.year_endpoint.format(year=start_year, format='json'), 'json'),
+                          'drivers')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("drivers records without a season were loaded")
+    return counts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', default=os.environ.get('DATABASE_URL'), help="Database to check against.")
+    parser.add_argument('--years', default='2021-2023', help="Seasons to load (default: 2021-2023).")
+    args = parser.parse_args(argv)
+
+    try:
+        import psycopg2
+    except ImportError:
+        print("Skipped: psycopg2 is not installed (pip install -e .[postgres])")
+        return 0
+    if not args.dsn:
+        print("Skipped: set DATABASE_URL or pass --dsn")
+        return 0
+
+    start_year, _, end_year = args.years.partition('-')
+    schema = f"f1ai_check_{uuid.uuid4().hex[:8]}"
+    connection = psycopg2.connect(args.dsn)
+    try:
+        with connection, connection.cursor() as cursor:
+            cursor.execute(f"CREATE SCHEMA {schema}")
+            cursor.execute(f"SET search_path TO {schema}, pg_temp")
+        with MockErgastServer() as server:
+            counts = check(connection, server.base_url, int(start_year), int(end_year or start_year))
+        print(f"PostgresSink OK: {counts}")
+    finally:
+        with connection, connection.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        connection.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
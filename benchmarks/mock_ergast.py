@@ -0,0 +1,241 @@
+"""Local stand-in for the Ergast API, serving pages built from the CSVs in data/.
+
+Serves the same URLs the extractors use (e.g. /api/f1/2010/drivers.json,
+/api/f1/1987.xml, /api/f1/races.json?limit=1000&offset=0) in JSON or XML,
+with optional latency, error injection and synthetic scaling of every table.
+
+    python benchmarks/mock_ergast.py --port 8000 --scale 10 --latency 0.05
+"""
+import os
+import re
+import csv
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from xml.sax.saxutils import escape, quoteattr
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+NAMESPACE = 'http://ergast.com/mrd/1.5'
+MAX_LIMIT = 1000
+
+# Table name -> (JSON table key, JSON list key, XML row tag)
+TABLES = {
+    'circuits': ('CircuitTable', 'Circuits', 'Circuit'),
+    'constructors': ('ConstructorTable', 'Constructors', 'Constructor'),
+    'drivers': ('DriverTable', 'Drivers', 'Driver'),
+    'races': ('RaceTable', 'Races', 'Race'),
+    'seasons': ('SeasonTable', 'Seasons', 'Season'),
+}
+
+# Fields the real API sends as XML attributes rather than child elements
+XML_ATTRIBUTES = {'circuitId', 'constructorId', 'driverId', 'code', 'url', 'season', 'round', 'lat', 'long'}
+
+# (file, season column or None, id column suffixed when scaling)
+SOURCES = {
+    'circuits': ('all_circuits_1950_2023.csv', 'Year', 'circuitId'),
+    'constructors': ('all_constructors_1950_2023.csv', 'year', 'constructorId'),
+    'drivers': ('all_drivers_1950_2023.csv', 'year', 'driverId'),
+    'races': ('all_race_schedule_data.csv', 'season', 'round'),
+    'seasons': ('seasons_data.csv', None, None),
+}
+UNFILTERED_SOURCES = {
+    'circuits': 'circuits_data.csv',
+    'constructors': 'constructors_data.csv',
+    'drivers': 'drivers_data.csv',
+}
+
+def _nest(row):
+    """Turn a flat CSV row ('Location.lat': ...) into the API's nested record."""
+    record = {}
+    for column, value in row.items():
+        if value == '':
+            continue
+        *parents, key = column.split('.')
+        target = record
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[key] = value
+    return record
+
+def _scale_rows(rows, id_column, scale):
+    """Repeat every row scale times, giving the copies distinct ids."""
+    if scale <= 1 or id_column is None:
+        return rows
+    scaled = []
+    for copy in range(scale):
+        for row in rows:
+            row = dict(row)
+            if copy:
+                if id_column == 'round':
+                    row['round'] = str(int(row['round']) + copy * 100)
+                else:
+                    row[id_column] = f"{row[id_column]}_{copy}"
+            scaled.append(row)
+    return scaled
+
+def _read_csv(filename):
+    with open(os.path.join(DATA_DIR, filename), newline='') as csv_file:
+        return list(csv.DictReader(csv_file))
+
+class ErgastData:
+    """Records per table and season, built once from the CSVs."""
+
+    def __init__(self, scale=1):
+        self.by_season = {}
+        self.unfiltered = {}
+        for table, (filename, season_column, id_column) in SOURCES.items():
+            rows = _scale_rows(_read_csv(filename), id_column, scale)
+            seasons = {}
+            for row in rows:
+                season = row.pop(season_column) if season_column not in (None, 'season') else row.get('season')
+                seasons.setdefault(season, []).append(_nest(row))
+            self.by_season[table] = seasons
+            if table in UNFILTERED_SOURCES:
+                unfiltered = _scale_rows(_read_csv(UNFILTERED_SOURCES[table]), id_column, scale)
+                self.unfiltered[table] = [_nest(row) for row in unfiltered]
+            else:
+                self.unfiltered[table] = [record for records in seasons.values() for record in records]
+
+    def records(self, table, season=None):
+        if season is None:
+            return self.unfiltered[table]
+        return self.by_season[table].get(season, [])
+
+def render_json(table, records, limit, offset, total, url):
+    table_key, list_key, _ = TABLES[table]
+    body = {'MRData': {
+        'xmlns': NAMESPACE, 'series': 'f1', 'url': url,
+        'limit': str(limit), 'offset': str(offset), 'total': str(total),
+        table_key: {list_key: records},
+    }}
+    return json.dumps(body).encode('utf-8')
+
+def _xml_element(tag, value):
+    if not isinstance(value, dict):
+        return f"<{tag}>{escape(value)}</{tag}>"
+    attributes = ''.join(f" {key}={quoteattr(item)}" for key, item in value.items()
+                         if key in XML_ATTRIBUTES and not isinstance(item, dict))
+    children = ''.join(_xml_element(key if isinstance(item, dict) else key[:1].upper() + key[1:], item)
+                       for key, item in value.items()
+                       if isinstance(item, dict) or key not in XML_ATTRIBUTES)
+    return f"<{tag}{attributes}>{children}</{tag}>"
+
+def render_xml(table, records, limit, offset, total, url):
+    table_key, _, row_tag = TABLES[table]
+    if table == 'seasons':
+        rows = ''.join(f"<Season url={quoteattr(record['url'])}>{escape(record['season'])}</Season>" for record in records)
+    else:
+        rows = ''.join(_xml_element(row_tag, record) for record in records)
+    return (f'<?xml version="1.0" encoding="utf-8"?>'
+            f'<MRData xmlns="{NAMESPACE}" series="f1" url={quoteattr(url)} '
+            f'limit="{limit}" offset="{offset}" total="{total}">'
+            f'<{table_key}>{rows}</{table_key}></MRData>').encode('utf-8')
+
+# /api/f1[/{season}]/{table}.{format} or /api/f1/{season}.{format} (the race schedule)
+ROUTE = re.compile(r'^/api/f1(?:/(?P<season>\d{4}))?(?:/(?P<table>[a-z]+))?\.(?P<format>json|xml)$')
+
+class MockErgastServer:
+    """Threaded HTTP server emulating the Ergast API."""
+
+    def __init__(self, host='127.0.0.1', port=0, scale=1, latency=0.0, error_rate=0.0, seed=0):
+        self.data = ErgastData(scale)
+        # Seconds slept before each response
+        self.latency = latency
+        # Fraction of requests answered with a 500 or 429
+        self.error_rate = error_rate
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/f1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def respond(self, path):
+        """Return (status, content type, body, headers) for a request path."""
+        with self._lock:
+            self.request_count += 1
+            failure = self._random.random() < self.error_rate
+            status = self._random.choice([429, 500]) if failure else 200
+        if self.latency:
+            time.sleep(self.latency)
+        if failure:
+            return status, 'text/plain', b'injected error', {'Retry-After': '0'} if status == 429 else {}
+
+        url = urlparse(path)
+        match = ROUTE.match(url.path)
+        if match is None:
+            return 404, 'text/plain', b'not found', {}
+        table = match.group('table') or 'races'
+        if table not in TABLES:
+            return 404, 'text/plain', b'not found', {}
+
+        query = parse_qs(url.query)
+        limit = min(int(query.get('limit', ['30'])[0]), MAX_LIMIT)
+        offset = int(query.get('offset', ['0'])[0])
+        records = self.data.records(table, match.group('season'))
+        render = render_json if match.group('format') == 'json' else render_xml
+        body = render(table, records[offset:offset + limit], limit, offset, len(records), url.path)
+        content_type = 'application/json' if match.group('format') == 'json' else 'application/xml'
+        return 200, content_type, body, {}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, content_type, body, headers = server.respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Ergast API.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--scale', type=int, default=1, help="Repeat every table this many times.")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds of delay per request.")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail.")
+    args = parser.parse_args(argv)
+
+    server = MockErgastServer(args.host, args.port, args.scale, args.latency, args.error_rate)
+    print(f"Serving mock Ergast API at {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
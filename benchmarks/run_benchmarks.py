@@ -0,0 +1,132 @@
+"""Benchmark the extractors against the local mock Ergast server.
+
+Each case runs in a fresh process so its peak RSS is its own; the mock
+server runs in this process and counts the requests each case makes.
+
+    python benchmarks/run_benchmarks.py --scale 10 --latency 0.02
+    python benchmarks/run_benchmarks.py --endpoints drivers races --modes serial planned --json bench.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+import io
+import multiprocessing
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Benchmark the working tree even when the package is not installed
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+sys.path.insert(0, HERE)
+
+from mock_ergast import MockErgastServer
+
+# Endpoint name -> (module, extractor class)
+EXTRACTORS = {
+    'circuits': ('f1ai.circuit_endpoint', 'CircuitDataExtractor'),
+    'constructors': ('f1ai.constructors_endpoint', 'ConstructorsDataExtractor'),
+    'drivers': ('f1ai.drivers_endpoint', 'DriversDataExtractor'),
+    'races': ('f1ai.race_schedule_endpoint', 'RaceScheduleDataExtractor'),
+    'seasons': ('f1ai.seasons_endpoint', 'SeasonsDataExtractor'),
+}
+MODES = ['serial', 'parallel', 'planned']
+
+def run_case(base_url, name, mode, start_year, end_year, workers, format):
+    """Run one extractor in one mode; executed in a child process."""
+    import importlib
+    import resource
+    from f1ai.collectors import collect_frame
+    from f1ai.planner import RequestPlanner
+
+    module_name, class_name = EXTRACTORS[name]
+    extractor_class = getattr(importlib.import_module(module_name), class_name)
+    extractor = extractor_class(base_url, max_workers=workers if mode == 'parallel' else 1)
+
+    # Time the parse stage by wrapping the decode and DataFrame steps
+    timings = {'decode': 0.0, 'frame': 0.0}
+    def timed(step, function):
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings[step] += time.perf_counter() - started
+        return wrapper
+    extractor.decode_page = timed('decode', extractor.decode_page)
+    extractor.page_frame = timed('frame', extractor.page_frame)
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == 'planned':
+            planner = RequestPlanner(format=format)
+            data = planner.execute(planner.plan(name, range(start_year, end_year + 1)), extractor)
+        elif name == 'seasons':
+            # Keep the requested seasons, as the planned mode does, so every mode returns the same rows
+            in_range = lambda record: start_year <= int(record['season']) <= end_year
+            data = collect_frame(extractor.iter_pages(f"seasons.{format}", format, record_filter=in_range))
+        else:
+            data = collect_frame(extractor.iter_years_pages(start_year, end_year, format))
+    wall = time.perf_counter() - started
+
+    return {
+        'rows': len(data),
+        'wall_s': wall,
+        'decode_s': timings['decode'],
+        'frame_s': timings['frame'],
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+def run(args):
+    results = []
+    context = multiprocessing.get_context('spawn')
+    with MockErgastServer(scale=args.scale, latency=args.latency, error_rate=args.error_rate) as server:
+        for name in args.endpoints:
+            for mode in args.modes:
+                requests_before = server.request_count
+                with context.Pool(1) as pool:
+                    result = pool.apply(run_case, (server.base_url, name, mode, args.years[0], args.years[1],
+                                                   args.workers, args.format))
+                result.update({
+                    'endpoint': name,
+                    'mode': mode,
+                    'requests': server.request_count - requests_before,
+                })
+                result['requests_per_s'] = result['requests'] / result['wall_s'] if result['wall_s'] else 0.0
+                results.append(result)
+                print_result(result)
+    return results
+
+def print_result(result):
+    print(f"{result['endpoint']:<13}{result['mode']:<10}{result['rows']:>9}{result['requests']:>9}"
+          f"{result['wall_s']:>10.3f}{result['requests_per_s']:>10.1f}{result['decode_s']:>10.3f}"
+          f"{result['frame_s']:>10.3f}{result['peak_rss_mb']:>10.1f}")
+
+def parse_years(value):
+    start, _, end = value.partition('-')
+    return int(start), int(end or start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the extractors against a local mock Ergast API.")
+    parser.add_argument('--endpoints', nargs='+', choices=sorted(EXTRACTORS), default=sorted(EXTRACTORS))
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES)
+    parser.add_argument('--years', type=parse_years, default=(1950, 2023))
+    parser.add_argument('--format', choices=['json', 'xml'], default='json')
+    parser.add_argument('--workers', type=int, default=8, help="Pool width for the parallel mode.")
+    parser.add_argument('--scale', type=int, default=1, help="Repeat every table this many times (e.g. 10 or 100).")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds of mock latency per request.")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail.")
+    parser.add_argument('--json', help="Also write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    print(f"{'endpoint':<13}{'mode':<10}{'rows':>9}{'requests':>9}{'wall s':>10}{'req/s':>10}"
+          f"{'decode s':>10}{'frame s':>10}{'rss MB':>10}")
+    results = run(args)
+    if args.json:
+        with open(args.json, 'w') as output:
+            json.dump(results, output, indent=2)
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
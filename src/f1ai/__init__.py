@@ -0,0 +1,38 @@
+"""Ergast API extractors and data tooling for FormulaOneAI.
+
+Importing the package does no work: the extractors and helpers below are
+only imported (together with pandas, requests, ...) when first accessed.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'CircuitDataExtractor': 'circuit_endpoint',
+    'ConstructorsDataExtractor': 'constructors_endpoint',
+    'DriversDataExtractor': 'drivers_endpoint',
+    'RaceScheduleDataExtractor': 'race_schedule_endpoint',
+    'SeasonsDataExtractor': 'seasons_endpoint',
+    'BaseDataExtractor': 'base_extractor',
+    'ResponseCache': 'response_cache',
+    'AsyncCrawler': 'async_crawler',
+    'IncrementalRefresher': 'incremental',
+    'PostgresSink': 'postgres_sink',
+    'NormalizedData': 'normalize',
+    'normalize': 'normalize',
+    'LookupStore': 'lookup',
+    'FeatureStore': 'features',
+    'PredictionService': 'predict',
+    'CrawlJournal': 'journal',
+    'ViewStore': 'views',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+    return getattr(module, name)
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,135 @@
+# import libraries
+import time
+import asyncio
+from collections import namedtuple
+from .collectors import collect_frame
+
+# One endpoint to crawl; year is set for per-season endpoints so the year column can be added
+CrawlJob = namedtuple('CrawlJob', ['name', 'extractor', 'endpoint', 'year'], defaults=[None])
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by every request of a crawl."""
+
+    def __init__(self, rate, burst=None, min_rate=0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def slow_down(self, factor=0.5):
+        """Cut the rate after throttling, server errors or slow responses."""
+        self.rate = max(self.min_rate, self.rate * factor)
+
+    def recover(self, factor=1.1):
+        """Creep back towards the configured rate after a healthy response."""
+        self.rate = min(self.max_rate, self.rate * factor)
+
+class AsyncCrawler:
+    """Crawl many endpoints concurrently under one rate limit and concurrency cap.
+
+    Requests still go through each extractor's fetch_page (so a ResponseCache
+    keeps working); they are run on worker threads and scheduled by asyncio.
+    """
+
+    def __init__(self, rate=4, burst=None, max_concurrency=8, max_retries=5,
+                 backoff=1.0, slow_response=5.0):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        # Base delay in seconds for exponential backoff on 429/5xx
+        self.backoff = backoff
+        # Responses slower than this many seconds also slow the crawl down
+        self.slow_response = slow_response
+
+    def run(self, jobs, format='json'):
+        """Crawl every job and return {job name: DataFrame}."""
+        return asyncio.run(self.crawl(jobs, format))
+
+    async def crawl(self, jobs, format='json'):
+        self._bucket = TokenBucket(self.rate, self.burst)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        pages = await asyncio.gather(*(self._crawl_job(job, format) for job in jobs))
+
+        # Gather keeps job order, so each name's pages stay in season and offset order
+        pages_by_name = {}
+        for job, job_pages in zip(jobs, pages):
+            pages_by_name.setdefault(job.name, []).extend(job_pages)
+        return {name: collect_frame(job_pages) for name, job_pages in pages_by_name.items()}
+
+    async def fetch_page(self, extractor, endpoint, offset):
+        """Fetch one page, retrying with backoff on 429, 5xx and failed requests."""
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire()
+            async with self._semaphore:
+                started = time.monotonic()
+                response = await asyncio.to_thread(extractor.fetch_page, endpoint, offset)
+                elapsed = time.monotonic() - started
+
+            # Offline cache misses would miss again, so they fail straight away
+            if getattr(response, 'cache_miss', False):
+                break
+            if response.status_code == 429 or response.status_code >= 500:
+                self._bucket.slow_down()
+                if attempt == self.max_retries:
+                    break
+                retry_after = response.headers.get('Retry-After', '')
+                delay = float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt
+                await asyncio.sleep(delay)
+                continue
+
+            if elapsed > self.slow_response:
+                self._bucket.slow_down()
+            else:
+                self._bucket.recover()
+            break
+        # Reported in the request metrics
+        response.retries = attempt
+        return response
+
+    async def _crawl_job(self, job, format):
+        extractor = job.extractor
+        first_page = await self.fetch_page(extractor, job.endpoint, 0)
+        if first_page.status_code != 200:
+            extractor.report_failure(job.endpoint, 0, first_page, first_page.retries)
+            return []
+
+        # Decode each body once and reuse the page for both pagination and parsing
+        first, frame = extractor.build_frame(job.endpoint, 0, first_page, format, retries=first_page.retries)
+        offsets = range(first.offset + first.limit, first.total, first.limit) if first.limit > 0 else []
+        responses = await asyncio.gather(*(self.fetch_page(extractor, job.endpoint, page_offset)
+                                            for page_offset in offsets))
+
+        pages = [frame]
+        for page_offset, response in zip(offsets, responses):
+            if response.status_code != 200:
+                extractor.report_failure(job.endpoint, page_offset, response, response.retries)
+                break
+            pages.append(extractor.build_frame(job.endpoint, page_offset, response, format,
+                                               retries=response.retries)[1])
+
+        if job.year is not None and extractor.year_column is not None:
+            for page in pages:
+                page[extractor.year_column] = job.year  # Add a column for the year
+        return pages
+
+def year_jobs(name, extractor, start_year=1950, end_year=2023, format='json'):
+    """Build one CrawlJob per season for an extractor with a year_endpoint."""
+    return [CrawlJob(name, extractor, extractor.year_endpoint.format(year=year, format=format), year)
+            for year in range(start_year, end_year + 1)]
@@ -0,0 +1,192 @@
+# import libraries
+import time
+import logging
+import requests
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from .collectors import collect_frame
+from .parsing import decode_page
+from .response_cache import CacheMissError, CachedResponse
+
+logger = logging.getLogger(__name__)
+
+# Status given to requests that raised (connection errors, timeouts), so they are retried like a 5xx
+REQUEST_ERROR_STATUS = 599
+# Status given to pages missing from the cache in offline mode; these are not retried
+CACHE_MISS_STATUS = 504
+
+class BaseDataExtractor:
+    """Pagination logic shared by every Ergast endpoint extractor."""
+    page_limit = 30
+    # Seconds to wait for the server to connect and to send each part of the response
+    timeout = 30
+    # Path to the records in the JSON response, e.g. ('MRData', 'DriverTable', 'Drivers')
+    table_path = None
+    # Per-season endpoint template and the column that records the season
+    year_endpoint = None
+    year_column = None
+
+    def __init__(self, base_url, max_workers=1, cache=None, instrumentation=None, journal=None):
+        self.base_url = base_url
+        # Number of pages fetched concurrently; 1 keeps the serial behaviour
+        self.max_workers = max_workers
+        # Optional ResponseCache that serves pages from local disk
+        self.cache = cache
+        # Optional Instrumentation that records per-request metrics
+        self.instrumentation = instrumentation
+        # Optional CrawlJournal: completed pages are replayed from it, new ones are recorded
+        self.journal = journal
+        # Pages that could not be fetched, so callers can tell a partial crawl from a complete one
+        self.failures = 0
+
+    def fetch_page(self, endpoint, offset, limit=None):
+        """Fetch a single page of an endpoint starting at the given offset."""
+        url = f"{self.base_url}/{endpoint}"
+        limit = limit or self.page_limit
+        params = {'limit': limit, 'offset': offset}
+        headers = {'Accept': 'application/json'}
+        started_at = time.time()
+        started = time.perf_counter()
+        response = self.journal.get(endpoint, offset, limit) if self.journal is not None else None
+        if response is not None:
+            logger.debug("Replaying from the journal: %s?limit=%s&offset=%s", url, limit, offset)
+        else:
+            logger.debug("Fetching data from: %s?limit=%s&offset=%s", url, limit, offset)
+            try:
+                if self.cache is not None:
+                    response = self.cache.fetch(url, params=params, headers=headers, endpoint=endpoint,
+                                                timeout=self.timeout)
+                else:
+                    # Make a GET request to the API
+                    response = requests.get(url, params=params, headers=headers, timeout=self.timeout)
+            except requests.RequestException as error:
+                response = CachedResponse(url, REQUEST_ERROR_STATUS, f"{type(error).__name__}: {error}".encode())
+                response.from_cache = False
+            except CacheMissError as error:
+                response = CachedResponse(url, CACHE_MISS_STATUS, str(error).encode())
+                response.from_cache = False
+                response.cache_miss = True
+        # Kept on the response so the metrics and journal entry recorded after parsing can include it
+        response.started_at = started_at
+        response.latency_s = time.perf_counter() - started
+        response.request_limit = limit
+        return response
+
+    def decode_page(self, response, format):
+        """Decode a response body once into a Page of records plus limit/offset/total."""
+        return decode_page(response.content, format, self.table_path)
+
+    def page_frame(self, page):
+        """Build the DataFrame of a decoded page."""
+        return pd.json_normalize(page.records)
+
+    def parse_data(self, response, format=None):
+        """Parse the response data and return a structured format."""
+        return self.page_frame(self.decode_page(response, format))
+
+    def fetch_data(self, endpoint, format=None, max_workers=None):
+        """Fetch every page of an endpoint and return them as one DataFrame."""
+        return collect_frame(self.iter_pages(endpoint, format, max_workers))
+
+    def iter_pages(self, endpoint, format=None, max_workers=None, limit=None, record_filter=None):
+        """Yield the parsed DataFrame of each page of an endpoint, in offset order.
+
+        record_filter, if given, is called with each raw record and drops the
+        records it returns False for before the DataFrame is built.
+        """
+        max_workers = max_workers or self.max_workers
+        if max_workers > 1:
+            yield from self._iter_pages_parallel(endpoint, format, max_workers, limit, record_filter)
+            return
+
+        offset = 0
+        total = None
+
+        while total is None or offset < total:
+            response = self.fetch_page(endpoint, offset, limit)
+
+            # Check the response status code
+            if response.status_code == 200:
+                page, frame = self.build_frame(endpoint, offset, response, format, record_filter)
+                yield frame
+
+                # Update the offset for the next iteration
+                offset = page.offset + page.limit
+                total = page.total
+            else:
+                self.report_failure(endpoint, offset, response)
+                break  # or handle according to your specific needs
+
+    def iter_records(self, endpoint, format=None, max_workers=None):
+        """Yield the records of an endpoint one dictionary at a time."""
+        for page in self.iter_pages(endpoint, format, max_workers):
+            yield from page.to_dict('records')
+
+    def iter_years_pages(self, start_year, end_year, format='json'):
+        """Yield the pages of year_endpoint for every season in the range."""
+        for year in range(start_year, end_year + 1):
+            endpoint = self.year_endpoint.format(year=year, format=format)
+            for page in self.iter_pages(endpoint, format):
+                if self.year_column is not None:
+                    page[self.year_column] = year  # Add a column for the year
+                yield page
+
+    def _iter_pages_parallel(self, endpoint, format, max_workers, limit=None, record_filter=None):
+        """Read the first page, plan the remaining offsets and fetch them concurrently."""
+        first_page = self.fetch_page(endpoint, 0, limit)
+        if first_page.status_code != 200:
+            self.report_failure(endpoint, 0, first_page)
+            return
+
+        page, frame = self.build_frame(endpoint, 0, first_page, format, record_filter)
+        yield frame
+        # MRData.total on the first page tells us every offset we will need
+        offsets = range(page.offset + page.limit, page.total, page.limit) if page.limit > 0 else []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # executor.map yields in submission order, so pages stay in offset order
+            responses = executor.map(lambda page_offset: self.fetch_page(endpoint, page_offset, limit), offsets)
+            for page_offset, response in zip(offsets, responses):
+                if response.status_code != 200:
+                    self.report_failure(endpoint, page_offset, response)
+                    break
+                yield self.build_frame(endpoint, page_offset, response, format, record_filter)[1]
+
+    def build_frame(self, endpoint, offset, response, format, record_filter=None, retries=0):
+        """Decode and frame one response, recording its metrics; returns (page, frame)."""
+        started = time.perf_counter()
+        page = self.decode_page(response, format)
+        decoded = time.perf_counter()
+        frame = self._filtered_frame(page, record_filter)
+        framed = time.perf_counter()
+        self._record(endpoint, offset, response, decoded - started, framed - decoded, len(frame), retries)
+        if self.journal is not None and not getattr(response, 'from_journal', False):
+            self.journal.complete(endpoint, offset, self._request_limit(response), page, response.content)
+        return page, frame
+
+    def report_failure(self, endpoint, offset, response, retries=0):
+        """Log and record a request that did not return 200."""
+        self.failures += 1
+        self._record(endpoint, offset, response, retries=retries)
+        if self.journal is not None:
+            self.journal.fail(endpoint, offset, self._request_limit(response), response.status_code, response.text[:200])
+        logger.warning("Failed to fetch data: %s (%s offset %s): %s",
+                       response.status_code, endpoint, offset, response.text[:200])
+
+    def _request_limit(self, response):
+        return getattr(response, 'request_limit', None) or self.page_limit
+
+    def _filtered_frame(self, page, record_filter):
+        if record_filter is not None:
+            page = page._replace(records=[record for record in page.records if record_filter(record)])
+        return self.page_frame(page)
+
+    def _record(self, endpoint, offset, response, decode_s=0.0, frame_s=0.0, rows=0, retries=0):
+        if self.instrumentation is None:
+            return
+        self.instrumentation.record(
+            endpoint, getattr(response, 'url', ''), offset, response,
+            latency_s=getattr(response, 'latency_s', 0.0),
+            decode_s=decode_s, frame_s=frame_s, rows=rows, retries=retries,
+            started_at=getattr(response, 'started_at', None),
+        )
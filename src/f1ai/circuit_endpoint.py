@@ -0,0 +1,20 @@
+# import libraries
+import pandas as pd
+from .base_extractor import BaseDataExtractor
+from .collectors import collect_frame
+
+class CircuitDataExtractor(BaseDataExtractor):
+    table_path = ('MRData', 'CircuitTable', 'Circuits')
+    year_endpoint = "{year}/circuits.{format}"
+    year_column = "Year"
+
+    def save_data_to_csv(self, data, file_name):
+        """Save the data to a CSV file."""
+        df = pd.DataFrame(data)
+        df.to_csv(file_name, index=False)
+        print(f"Data saved to {file_name}")
+    
+    def fetch_all_years_data(self, start_year=1950, end_year=2023):
+        """Fetch the circuits of every season within the range."""
+        # Collect every season's pages in a single pass
+        return collect_frame(self.iter_years_pages(start_year, end_year))
@@ -0,0 +1,284 @@
+"""Command line entry point, e.g. `f1ai fetch drivers --years 2010-2023 --format parquet`.
+
+Only the standard library is imported at startup; pandas, requests and
+pyarrow are imported inside the subcommand that needs them, so `--help`
+returns immediately.
+"""
+import argparse
+import importlib
+import logging
+import os
+
+BASE_URL = "http://ergast.com/api/f1"
+
+# Endpoint name -> (module, extractor class)
+EXTRACTORS = {
+    'circuits': ('circuit_endpoint', 'CircuitDataExtractor'),
+    'constructors': ('constructors_endpoint', 'ConstructorsDataExtractor'),
+    'drivers': ('drivers_endpoint', 'DriversDataExtractor'),
+    'races': ('race_schedule_endpoint', 'RaceScheduleDataExtractor'),
+    'seasons': ('seasons_endpoint', 'SeasonsDataExtractor'),
+}
+
+# Per-season endpoints in registry.ENDPOINTS that `f1ai ingest` can stream to disk
+INGEST_ENDPOINTS = ['circuits', 'constructors', 'drivers', 'laps', 'pitstops', 'qualifying', 'races', 'results']
+
+def parse_years(value):
+    """Parse "2010-2023" or "2023" into an inclusive (start, end) range."""
+    try:
+        start, _, end = value.partition('-')
+        start, end = int(start), int(end or start)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid year range: {value!r}")
+    if start > end:
+        raise argparse.ArgumentTypeError(f"invalid year range: {value!r}")
+    return start, end
+
+def default_output(name, start_year, end_year, data_dir):
+    """Keep the file names the endpoint scripts used to write."""
+    if name == 'races':
+        # The scripts wrote the full 1950-2023 schedule without a range in the name
+        if (start_year, end_year) == (1950, 2023):
+            return os.path.join(data_dir, 'all_race_schedule_data.csv')
+        return os.path.join(data_dir, f"all_race_schedule_{start_year}_{end_year}.csv")
+    if name == 'seasons':
+        return os.path.join(data_dir, 'seasons_data.csv')
+    return os.path.join(data_dir, f"all_{name}_{start_year}_{end_year}.csv")
+
+def default_model(table):
+    """One model bundle per table, so training one table never overwrites another's model."""
+    return os.path.join('data', 'models', f"{table}.joblib")
+
+def load_extractor(args):
+    module_name, class_name = EXTRACTORS[args.endpoint]
+    module = importlib.import_module(f".{module_name}", __package__)
+    cache = None
+    if not args.no_cache:
+        from .response_cache import ResponseCache
+        cache = ResponseCache(args.cache_dir, offline=args.offline)
+    instrumentation = None
+    if args.metrics:
+        from .instrumentation import Instrumentation
+        instrumentation = Instrumentation()
+    return getattr(module, class_name)(args.base_url, max_workers=args.workers, cache=cache,
+                                       instrumentation=instrumentation, journal=load_journal(args))
+
+def load_journal(args):
+    if not args.journal:
+        return None
+    from .journal import CrawlJournal
+    return CrawlJournal(args.journal)
+
+def report_gaps(journal, endpoints=None):
+    """Log what the crawl is still missing; a rerun with the same --journal fetches only that.
+
+    A crawl without gaps clears the journal, so the next crawl fetches fresh pages.
+    """
+    if journal is None:
+        return
+    if journal.gaps(endpoints):
+        logging.warning(journal.report(endpoints))
+    else:
+        logging.info(journal.report(endpoints))
+        journal.clear()
+    journal.close()
+
+def write_metrics(extractor, path):
+    """Write the crawl's request metrics as Prometheus text (.prom) or JSON lines."""
+    if path.endswith('.prom'):
+        extractor.instrumentation.write_prometheus(path)
+    else:
+        extractor.instrumentation.write_json_lines(path)
+    print(f"Metrics saved to {path}")
+
+def fetch(args):
+    from .collectors import collect_frame, write_csv_chunks
+
+    # Create the output directory before crawling, not after
+    os.makedirs(args.data_dir, exist_ok=True)
+    extractor = load_extractor(args)
+    start_year, end_year = args.years
+    expected = None
+    if args.incremental:
+        from .incremental import IncrementalRefresher
+        refresher = IncrementalRefresher(extractor, args.endpoint, data_dir=args.data_dir)
+        refresher.refresh(start_year, end_year)
+        pages = refresher.iter_partitions(start_year, end_year)
+    else:
+        from .planner import RequestPlanner
+        # Fewest round trips: largest page size and, where possible, one unfiltered query
+        planner = RequestPlanner(format=args.api_format)
+        plan = planner.plan(args.endpoint, range(start_year, end_year + 1))
+        print(f"Planned {plan.estimated_requests} request(s) for {args.endpoint}")
+        pages = planner.iter_pages(plan, extractor)
+        expected = [query.endpoint for query in plan.queries]
+
+    if args.format == 'csv':
+        rows = write_csv_chunks(pages, args.output or default_output(args.endpoint, start_year, end_year, args.data_dir))
+    else:
+        from .columnar import write_partitioned
+        root = args.output or os.path.join(args.data_dir, 'columnar')
+        data = collect_frame(pages)
+        rows = len(data)
+        if rows:
+            paths = write_partitioned(data, args.endpoint, root, args.format)
+            print(f"Data saved to {len(paths)} {args.format} partition(s) under {root}")
+
+    if args.metrics:
+        write_metrics(extractor, args.metrics)
+    report_gaps(extractor.journal, expected)
+    if not rows:
+        logging.error("No %s data was fetched for %s-%s", args.endpoint, start_year, end_year)
+        return 1
+    if extractor.failures:
+        logging.error("%s page(s) of %s could not be fetched; the output is incomplete",
+                      extractor.failures, args.endpoint)
+        return 1
+    return 0
+
+def ingest(args):
+    from .registry import ChunkedIngestor, extractor_for
+
+    cache = None
+    if not args.no_cache:
+        from .response_cache import ResponseCache
+        cache = ResponseCache(args.cache_dir, offline=args.offline)
+    extractor = extractor_for(args.endpoint, args.base_url, cache=cache, journal=load_journal(args))
+    root = args.output or os.path.join(args.data_dir, 'columnar')
+    ingestor = ChunkedIngestor(extractor, root, chunk_rows=args.chunk_rows, format=args.format)
+    rows = ingestor.ingest(*args.years)
+    print(f"Data saved to {len(rows)} {args.format} season partition(s) under {root} ({sum(rows.values())} rows)")
+    report_gaps(extractor.journal)
+    failed = args.years[1] - args.years[0] + 1 - len(rows)
+    if failed:
+        logging.error("Failed to ingest %s season(s) of %s; their previous parts were kept", failed, args.endpoint)
+        return 1
+    return 0
+
+def views(args):
+    from .views import ViewStore
+
+    store = ViewStore(args.source, args.output)
+    rebuilt = store.refresh(args.views)
+    for view, seasons in rebuilt.items():
+        print(f"{view}: rebuilt {len(seasons)} season(s) under {os.path.join(args.output, view)}")
+    return 0
+
+def build_features(args):
+    """Bring the feature store up to date from the extractor CSVs in --data-dir."""
+    import pandas as pd
+    from .features import FeatureStore
+
+    store = FeatureStore(args.features_dir)
+    data = pd.read_csv(default_output(args.table, 1950, 2023, args.data_dir))
+    rebuilt = store.build(args.table, data)
+    print(f"Features rebuilt for {len(rebuilt)} season(s) of {args.table}")
+    return store
+
+def train(args):
+    from .predict import train_model
+
+    store = build_features(args)
+    train_model(store, args.table, args.model or default_model(args.table))
+    return 0
+
+def predict(args):
+    import pandas as pd
+    from .features import FeatureStore
+    from .predict import PredictionService, next_season_scenarios
+
+    with PredictionService(args.model or default_model(args.table), workers=args.workers) as service:
+        if args.scenarios:
+            scenarios = pd.read_csv(args.scenarios)
+        else:
+            scenarios = next_season_scenarios(FeatureStore(args.features_dir), service.bundle['name'], args.season)
+        predictions = service.predict(scenarios)
+    predictions.to_csv(args.output, index=False)
+    print(f"Data saved to {args.output}")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='f1ai', description="FormulaOneAI data tools.")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log every request.")
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    fetch_parser = subcommands.add_parser('fetch', help="Fetch an Ergast endpoint and save it.")
+    fetch_parser.add_argument('endpoint', choices=sorted(EXTRACTORS))
+    fetch_parser.add_argument('--years', type=parse_years, default=(1950, 2023),
+                              help="Season or inclusive range, e.g. 2023 or 2010-2023 (default: 1950-2023).")
+    fetch_parser.add_argument('--format', choices=['csv', 'parquet', 'feather'], default='csv',
+                              help="Output format (default: csv).")
+    fetch_parser.add_argument('--output', help="Output CSV file or columnar root directory.")
+    fetch_parser.add_argument('--data-dir', default='data', help="Data directory (default: data).")
+    fetch_parser.add_argument('--base-url', default=BASE_URL)
+    fetch_parser.add_argument('--api-format', choices=['json', 'xml'], default='json',
+                              help="Response format requested from the API (default: json).")
+    fetch_parser.add_argument('--workers', type=int, default=1, help="Pages fetched concurrently (default: 1).")
+    fetch_parser.add_argument('--cache-dir', default=os.path.join('data', '.cache'))
+    fetch_parser.add_argument('--no-cache', action='store_true', help="Always hit the network.")
+    fetch_parser.add_argument('--offline', action='store_true', default=os.environ.get('F1AI_OFFLINE') == '1',
+                              help="Serve every request from the cache (or set F1AI_OFFLINE=1).")
+    fetch_parser.add_argument('--incremental', action='store_true',
+                              help="Only fetch seasons missing from the partitions under --data-dir.")
+    fetch_parser.add_argument('--metrics',
+                              help="Write per-request metrics to this file (.prom for Prometheus text, else JSON lines).")
+    fetch_parser.add_argument('--journal',
+                              help="Journal completed pages to this SQLite file; a rerun resumes from it and gaps are reported.")
+    fetch_parser.set_defaults(func=fetch)
+
+    ingest_parser = subcommands.add_parser('ingest', help="Stream a large endpoint to season partitions in fixed-size chunks.")
+    ingest_parser.add_argument('endpoint', choices=INGEST_ENDPOINTS)
+    ingest_parser.add_argument('--years', type=parse_years, default=(1950, 2023),
+                               help="Season or inclusive range (default: 1950-2023).")
+    ingest_parser.add_argument('--format', choices=['parquet', 'feather'], default='parquet')
+    ingest_parser.add_argument('--chunk-rows', type=int, help="Rows per chunk file (default: the endpoint's).")
+    ingest_parser.add_argument('--output', help="Columnar root directory (default: <data-dir>/columnar).")
+    ingest_parser.add_argument('--data-dir', default='data', help="Data directory (default: data).")
+    ingest_parser.add_argument('--base-url', default=BASE_URL)
+    ingest_parser.add_argument('--cache-dir', default=os.path.join('data', '.cache'))
+    ingest_parser.add_argument('--no-cache', action='store_true', help="Always hit the network.")
+    ingest_parser.add_argument('--offline', action='store_true', default=os.environ.get('F1AI_OFFLINE') == '1',
+                               help="Serve every request from the cache (or set F1AI_OFFLINE=1).")
+    ingest_parser.add_argument('--journal',
+                               help="Journal completed pages to this SQLite file; a rerun resumes from it and gaps are reported.")
+    ingest_parser.set_defaults(func=ingest)
+
+    views_parser = subcommands.add_parser('views', help="Rebuild the joined views whose input seasons changed.")
+    views_parser.add_argument('--view', dest='views', action='append', choices=['race_circuits', 'driver_constructors'],
+                              help="View to refresh; repeat for several (default: all).")
+    views_parser.add_argument('--source', default=os.path.join('data', 'columnar'),
+                              help="Columnar season partitions to build from (default: data/columnar).")
+    views_parser.add_argument('--output', default=os.path.join('data', 'views'),
+                              help="Directory the views are stored in (default: data/views).")
+    views_parser.set_defaults(func=views)
+
+    features_dir = os.path.join('data', 'features')
+    train_parser = subcommands.add_parser('train', help="Build the features and fit the presence model.")
+    train_parser.add_argument('table', choices=['circuits', 'constructors', 'drivers'])
+    train_parser.add_argument('--data-dir', default='data', help="Directory holding the extractor CSVs (default: data).")
+    train_parser.add_argument('--features-dir', default=features_dir)
+    train_parser.add_argument('--model', help="Model bundle to write (default: data/models/<table>.joblib).")
+    train_parser.set_defaults(func=train)
+
+    predict_parser = subcommands.add_parser('predict', help="Score scenarios with a trained model.")
+    predict_parser.add_argument('--table', choices=['circuits', 'constructors', 'drivers'], default='circuits',
+                                help="Table whose model is used when --model is not given (default: circuits).")
+    predict_parser.add_argument('--model', help="Model bundle (default: data/models/<table>.joblib).")
+    predict_parser.add_argument('--scenarios',
+                                help="CSV of scenarios with the model's feature columns "
+                                     "(default: every entity of the previous season).")
+    predict_parser.add_argument('--season', type=int, help="Season to predict (default: the one after the latest stored).")
+    predict_parser.add_argument('--features-dir', default=features_dir)
+    predict_parser.add_argument('--workers', type=int, default=None,
+                                help="Processes used for large batches (default: one per CPU).")
+    predict_parser.add_argument('--output', default='predictions.csv')
+    predict_parser.set_defaults(func=predict)
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format='%(levelname)s %(message)s')
+    if getattr(args, 'incremental', False) and args.endpoint == 'seasons':
+        parser.error("--incremental needs a per-season endpoint")
+    return args.func(args)
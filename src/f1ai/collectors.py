@@ -0,0 +1,55 @@
+# import libraries
+import os
+import shutil
+import tempfile
+import pandas as pd
+
+def collect_frame(pages):
+    """Build one DataFrame from an iterable of page DataFrames in a single pass."""
+    frames = [page for page in pages if not page.empty]
+    if not frames:
+        return pd.DataFrame()
+    # A single concat at the end instead of one per page keeps the cost linear
+    return pd.concat(frames, ignore_index=True)
+
+def write_csv_chunks(pages, filename):
+    """Stream page DataFrames to a CSV file without holding the full frame in memory.
+
+    Pages can carry different columns (e.g. drivers only gain `code` in later
+    seasons), so each page is spooled to its own part file first and the parts
+    are then copied into the final CSV under the union of all columns, in the
+    same order pd.concat would produce. Returns the number of rows written;
+    no file is written when there are none.
+    """
+    if not filename.endswith('.csv'):
+        filename += '.csv'
+
+    columns = []
+    parts = []
+    spool_dir = tempfile.mkdtemp(prefix='f1ai-chunks-')
+    try:
+        for page in pages:
+            if page.empty:
+                continue
+            columns.extend(column for column in page.columns if column not in columns)
+            part = os.path.join(spool_dir, f"part-{len(parts):06d}.csv")
+            page.to_csv(part, index=False)
+            parts.append(part)
+
+        if not parts:
+            # Nothing was fetched: leave any earlier output in place
+            return 0
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        rows = 0
+        with open(filename, 'w', newline='') as output:
+            pd.DataFrame(columns=columns).to_csv(output, index=False)
+            for part in parts:
+                # dtype=str keeps the values exactly as they were spooled
+                chunk = pd.read_csv(part, dtype=str, keep_default_na=False)
+                chunk.reindex(columns=columns).to_csv(output, index=False, header=False)
+                rows += len(chunk)
+    finally:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+    print(f"Data saved to {filename}")
+    return rows
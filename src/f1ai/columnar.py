@@ -0,0 +1,246 @@
+# import libraries
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+# Explicit column types per endpoint; columns not listed keep the type pandas gives them
+SCHEMAS = {
+    'circuits': {
+        'circuitId': 'category',
+        'url': 'string',
+        'circuitName': 'string',
+        'Location.lat': 'float64',
+        'Location.long': 'float64',
+        'Location.locality': 'category',
+        'Location.country': 'category',
+        'Year': 'Int16',
+    },
+    'drivers': {
+        'driverId': 'category',
+        'url': 'string',
+        'givenName': 'string',
+        'familyName': 'string',
+        'dateOfBirth': 'date',
+        'nationality': 'category',
+        'year': 'Int16',
+        'code': 'category',
+        'permanentNumber': 'Int16',
+    },
+    'constructors': {
+        'constructorId': 'category',
+        'url': 'string',
+        'name': 'string',
+        'nationality': 'category',
+        'year': 'Int16',
+    },
+    'races': {
+        'season': 'Int16',
+        'round': 'Int8',
+        'url': 'string',
+        'raceName': 'category',
+        'date': 'date',
+        'time': 'string',
+        'Circuit.circuitId': 'category',
+        'Circuit.url': 'string',
+        'Circuit.circuitName': 'category',
+        'Circuit.Location.lat': 'float64',
+        'Circuit.Location.long': 'float64',
+        'Circuit.Location.locality': 'category',
+        'Circuit.Location.country': 'category',
+        'FirstPractice.date': 'date',
+        'SecondPractice.date': 'date',
+        'ThirdPractice.date': 'date',
+        'Qualifying.date': 'date',
+        'Sprint.date': 'date',
+        'FirstPractice.time': 'string',
+        'SecondPractice.time': 'string',
+        'ThirdPractice.time': 'string',
+        'Qualifying.time': 'string',
+        'Sprint.time': 'string',
+    },
+    'seasons': {
+        'season': 'Int16',
+        'url': 'string',
+    },
+    # Nested per-race endpoints, flattened to one row per result/lap timing/stop
+    'results': {
+        'season': 'Int16',
+        'round': 'Int8',
+        'Circuit.circuitId': 'category',
+        'number': 'Int16',
+        'position': 'Int16',
+        'positionText': 'category',
+        'points': 'float64',
+        'grid': 'Int16',
+        'laps': 'Int16',
+        'status': 'category',
+        'Driver.driverId': 'category',
+        'Constructor.constructorId': 'category',
+        'Time.millis': 'Int32',
+        'Time.time': 'string',
+        'FastestLap.rank': 'Int16',
+        'FastestLap.lap': 'Int16',
+        'FastestLap.Time.time': 'string',
+        'FastestLap.AverageSpeed.units': 'category',
+        'FastestLap.AverageSpeed.speed': 'float64',
+    },
+    'qualifying': {
+        'season': 'Int16',
+        'round': 'Int8',
+        'Circuit.circuitId': 'category',
+        'number': 'Int16',
+        'position': 'Int16',
+        'Driver.driverId': 'category',
+        'Constructor.constructorId': 'category',
+        'Q1': 'string',
+        'Q2': 'string',
+        'Q3': 'string',
+    },
+    'laps': {
+        'season': 'Int16',
+        'round': 'Int8',
+        'Laps.number': 'Int16',
+        'driverId': 'category',
+        'position': 'Int16',
+        'time': 'string',
+    },
+    'pitstops': {
+        'season': 'Int16',
+        'round': 'Int8',
+        'driverId': 'category',
+        'lap': 'Int16',
+        'stop': 'Int8',
+        'time': 'string',
+        'duration': 'string',
+    },
+}
+
+# Column holding the season in each endpoint's output
+SEASON_COLUMNS = {
+    'circuits': 'Year',
+    'drivers': 'year',
+    'constructors': 'year',
+    'races': 'season',
+    'seasons': 'season',
+    'results': 'season',
+    'qualifying': 'season',
+    'laps': 'season',
+    'pitstops': 'season',
+}
+
+EXTENSIONS = {'parquet': 'parquet', 'feather': 'feather'}
+
+# Arrow type written for each schema type, so every season partition shares one schema
+ARROW_TYPES = {
+    'category': pa.dictionary(pa.int32(), pa.string()),
+    'string': pa.string(),
+    'date': pa.date32(),
+    'float64': pa.float64(),
+    'Int8': pa.int8(),
+    'Int16': pa.int16(),
+    'Int32': pa.int32(),
+}
+
+# Nullable pandas types for Arrow integers so missing values don't turn them into floats
+PANDAS_TYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+}
+
+def apply_schema(data, name):
+    """Cast the columns of an endpoint's DataFrame to the types in SCHEMAS."""
+    data = data.copy()
+    for column, dtype in SCHEMAS[name].items():
+        if column not in data.columns:
+            continue
+        values = data[column].replace('', None)
+        if dtype == 'date':
+            data[column] = pd.to_datetime(values, errors='coerce')
+        elif dtype in ('float64', 'Int8', 'Int16', 'Int32'):
+            data[column] = pd.to_numeric(values, errors='coerce').astype(dtype)
+        else:
+            data[column] = values.astype(dtype)
+    return data
+
+def to_arrow(data, name):
+    """Convert an endpoint's DataFrame to an Arrow table with its explicit schema."""
+    table = pa.Table.from_pandas(apply_schema(data, name), preserve_index=False)
+    schema = SCHEMAS[name]
+    fields = [pa.field(field.name, ARROW_TYPES[schema[field.name]]) if field.name in schema else field
+              for field in table.schema]
+    return table.cast(pa.schema(fields))
+
+def partition_path(root, name, season, format='parquet', part=0):
+    return os.path.join(root, name, f"season={season}", f"part-{part}.{EXTENSIONS[format]}")
+
+def season_parts(root, name, season, format='parquet'):
+    """List a season's part files in order (chunked ingestion writes several)."""
+    season_dir = os.path.dirname(partition_path(root, name, season, format))
+    if not os.path.isdir(season_dir):
+        return []
+    suffix = f".{EXTENSIONS[format]}"
+    parts = [entry for entry in os.listdir(season_dir) if entry.startswith('part-') and entry.endswith(suffix)]
+    parts.sort(key=lambda entry: int(entry[len('part-'):-len(suffix)]))
+    return [os.path.join(season_dir, entry) for entry in parts]
+
+def write_season(data, name, season, root, format='parquet', part=0):
+    """Write one season (or one chunk of a season) of an endpoint as a typed Parquet or Feather file."""
+    path = partition_path(root, name, season, format, part)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = to_arrow(data, name)
+    tmp_path = f"{path}.tmp"
+    if format == 'parquet':
+        pq.write_table(table, tmp_path)
+    elif format == 'feather':
+        # Uncompressed Feather can be memory-mapped without a copy
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+    os.replace(tmp_path, path)
+    return path
+
+def write_partitioned(data, name, root, format='parquet'):
+    """Write an endpoint's DataFrame partitioned by season; returns the written paths."""
+    if data.empty:
+        # Nothing was fetched (e.g. every page failed), so there is no season column to split on
+        return []
+    season_column = SEASON_COLUMNS[name]
+    return [write_season(partition, name, season, root, format)
+            for season, partition in data.groupby(season_column, sort=True)]
+
+def stored_seasons(name, root, format='parquet'):
+    """List the seasons stored for an endpoint."""
+    endpoint_dir = os.path.join(root, name)
+    if not os.path.isdir(endpoint_dir):
+        return []
+    seasons = [int(entry.split('=', 1)[1]) for entry in os.listdir(endpoint_dir) if entry.startswith('season=')]
+    return sorted(season for season in seasons if season_parts(root, name, season, format))
+
+def read_partitioned(name, root, seasons=None, columns=None, format='parquet', memory_map=True):
+    """Read an endpoint back, touching only the requested seasons and columns.
+
+    Season filters are applied to the partition directories, so unrequested
+    seasons are never opened; column filters are pushed down to the file reader.
+    """
+    wanted = stored_seasons(name, root, format)
+    if seasons is not None:
+        seasons = set(seasons)
+        wanted = [season for season in wanted if season in seasons]
+
+    tables = []
+    for season in wanted:
+        for path in season_parts(root, name, season, format):
+            if format == 'parquet':
+                tables.append(pq.read_table(path, columns=columns, memory_map=memory_map))
+            else:
+                tables.append(feather.read_table(path, columns=columns, memory_map=memory_map))
+
+    if not tables:
+        return pd.DataFrame(columns=columns)
+    # Seasons may lack optional columns (e.g. Sprint.date before 2021)
+    table = pa.concat_tables(tables, promote_options='default')
+    # date32 columns come back as datetime64 so they behave like real dates in pandas
+    return table.to_pandas(date_as_object=False, types_mapper=PANDAS_TYPES.get)
@@ -0,0 +1,20 @@
+# import libraries
+from .base_extractor import BaseDataExtractor
+from .collectors import collect_frame
+
+class ConstructorsDataExtractor(BaseDataExtractor):
+    table_path = ('MRData', 'ConstructorTable', 'Constructors')
+    year_endpoint = "{year}/constructors.{format}"
+    year_column = "year"
+
+    def save_data_to_csv(self, data, filename):
+        """Save the data to a CSV file."""
+        if not filename.endswith('.csv'):
+            filename += '.csv'
+        data.to_csv(filename, index=False)
+        print(f"Data saved to {filename}")
+    
+    def fetch_all_years_data(self, start_year, end_year):
+        """Fetch data for all years within the range."""
+        # Collect every season's pages in a single pass
+        return collect_frame(self.iter_years_pages(start_year, end_year))
@@ -0,0 +1,19 @@
+# import libraries
+from .base_extractor import BaseDataExtractor
+from .collectors import collect_frame
+
+class DriversDataExtractor(BaseDataExtractor):
+    table_path = ('MRData', 'DriverTable', 'Drivers')
+    year_endpoint = "{year}/drivers.{format}"
+    year_column = "year"
+
+    def save_data_to_csv(self, data, filename):
+        """Save the data to a CSV file."""
+        if not filename.endswith('.csv'):
+            filename += '.csv'
+        data.to_csv(filename, index=False)
+        print(f"Data saved to: {filename}")
+    
+    def fetch_all_years_ddata(self, start_year=1950, end_year=2023):
+        # Collect every season's pages in a single pass
+        return collect_frame(self.iter_years_pages(start_year, end_year))
@@ -0,0 +1,225 @@
+# import libraries
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from .columnar import SEASON_COLUMNS, partition_path
+from .incremental import Manifest
+
+# Bump whenever a feature definition changes; every stored season is then rebuilt
+FEATURE_VERSION = 1
+
+# Seasons covered by the rolling window features
+WINDOW = 5
+
+# Entity table -> (id column, categorical columns encoded with stable codes)
+ENTITIES = {
+    'circuits': ('circuitId', ['Location.locality', 'Location.country']),
+    'drivers': ('driverId', ['nationality']),
+    'constructors': ('constructorId', ['nationality']),
+}
+
+# Spellings merged before encoding (the circuits data uses both)
+ALIASES = {'Location.country': {'United States': 'USA'}}
+
+# Target: does the entity appear again the following season (NA for the latest season)
+TARGET = 'present_next_season'
+
+# Model inputs per table; the circuits set extends the notebook's locality/country/Year model
+FEATURE_COLUMNS = {
+    'circuits': ['Location.locality', 'Location.country', 'season', 'Location.lat', 'Location.long',
+                 'seasons_before', 'seasons_since_first', 'gap', 'present_last_season', f'present_last_{WINDOW}',
+                 'season_entities', 'season_new_entities', 'season_entities_rolling', 'country_entities'],
+    'drivers': ['nationality', 'season', 'age', 'seasons_before', 'seasons_since_first', 'gap',
+                'present_last_season', f'present_last_{WINDOW}', 'season_entities', 'season_new_entities',
+                'season_entities_rolling'],
+    'constructors': ['nationality', 'season', 'seasons_before', 'seasons_since_first', 'gap',
+                     'present_last_season', f'present_last_{WINDOW}', 'season_entities', 'season_new_entities',
+                     'season_entities_rolling'],
+}
+
+class Encodings:
+    """Append-only category -> integer code mappings, persisted as JSON.
+
+    New categories are appended after the known ones, so a value keeps its
+    code across rebuilds and stored features never need re-encoding.
+    Unknown values encode to -1.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.vocabularies = {}
+        if path and os.path.exists(path):
+            with open(path) as encodings_file:
+                self.vocabularies = json.load(encodings_file)
+
+    def update(self, column, values):
+        vocabulary = self.vocabularies.setdefault(column, [])
+        known = set(vocabulary)
+        vocabulary.extend(sorted(set(pd.Series(values).dropna().astype(str)) - known))
+
+    def encode(self, column, values):
+        categories = self.vocabularies.get(column, [])
+        codes = pd.Categorical(pd.Series(values).astype('string'), categories=categories).codes
+        return codes.astype('int32')
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as encodings_file:
+            json.dump(self.vocabularies, encodings_file, indent=2)
+        os.replace(tmp_path, self.path)
+
+def clean(data, name):
+    """One row per (id, season) with the season column named 'season' and aliases applied."""
+    id_column, categorical = ENTITIES[name]
+    data = data.rename(columns={SEASON_COLUMNS[name]: 'season'})
+    data = data.drop_duplicates([id_column, 'season'], keep='last')
+    for column, aliases in ALIASES.items():
+        if column in data.columns:
+            data[column] = data[column].replace(aliases)
+    data['season'] = data['season'].astype('int64')
+    return data.sort_values([id_column, 'season'], kind='stable').reset_index(drop=True)
+
+def season_digests(data, name):
+    """Hash each season's input rows, independent of row and column order."""
+    columns = sorted(data.columns)
+    # One vectorised pass hashes every row; clean() sorted the rows by (id, season)
+    hashed = pd.util.hash_pandas_object(data[columns].astype('string'), index=False).to_numpy()
+    seasons = data['season'].to_numpy()
+    order = np.argsort(seasons, kind='stable')
+    unique, starts = np.unique(seasons[order], return_index=True)
+    header = ','.join(columns).encode()
+    return {int(season): hashlib.sha256(header + rows.tobytes()).hexdigest()
+            for season, rows in zip(unique, np.split(hashed[order], starts[1:]))}
+
+def season_fingerprints(digests, name):
+    """Fingerprint every season's features by the inputs they depend on.
+
+    Season S reads the history up to S (cumulative and rolling features) and
+    S + 1 (the target), so a change in season S invalidates S - 1 onwards.
+    """
+    fingerprints = {}
+    history = hashlib.sha256(f"{name}:{FEATURE_VERSION}".encode())
+    for season in sorted(digests):
+        history.update(digests[season].encode())
+        fingerprint = history.copy()
+        fingerprint.update(digests.get(season + 1, 'latest').encode())
+        fingerprints[season] = fingerprint.hexdigest()
+    return fingerprints
+
+def compute_features(data, name, encodings):
+    """Vectorised features for every (id, season) row of a cleaned frame."""
+    id_column, categorical = ENTITIES[name]
+    features = pd.DataFrame({id_column: data[id_column].astype(str).to_numpy(), 'season': data['season'].to_numpy()})
+    for column in categorical:
+        features[column] = encodings.encode(column, data[column])
+
+    seasons = features['season'].to_numpy()
+    ids = pd.factorize(features[id_column])[0].astype('int64')
+    group = features.groupby(id_column, sort=False)['season']
+
+    # History of the entity up to and including the season
+    features['seasons_before'] = group.cumcount().astype('int32')
+    features['seasons_since_first'] = (seasons - group.transform('min').to_numpy()).astype('int32')
+    previous = group.shift(1)
+    features['gap'] = (features['season'] - previous).astype('Int16')
+    features['present_last_season'] = (previous == features['season'] - 1).astype('int8')
+    # Appearances in the WINDOW seasons before this one: rows are sorted by (id, season),
+    # so a binary search over the composite key counts them without a Python loop
+    keys = ids * 10000 + seasons
+    window_start = np.searchsorted(keys, keys - WINDOW, side='left')
+    features[f'present_last_{WINDOW}'] = (np.arange(len(keys)) - window_start).astype('int8')
+    following = group.shift(-1)
+    target = (following == features['season'] + 1).astype('Int8')
+    target[seasons == seasons.max()] = pd.NA
+    features[TARGET] = target
+
+    # Rolling season-level stats, joined back onto every row of the season
+    per_season = pd.DataFrame({
+        'season_entities': features.groupby('season').size(),
+        'season_new_entities': (features['seasons_before'] == 0).groupby(features['season']).sum(),
+    })
+    per_season['season_entities_rolling'] = per_season['season_entities'].rolling(WINDOW, min_periods=1).mean()
+    features = features.join(per_season, on='season')
+
+    if name == 'circuits':
+        features['Location.lat'] = data['Location.lat'].astype('float64').to_numpy()
+        features['Location.long'] = data['Location.long'].astype('float64').to_numpy()
+        features['country_entities'] = features.groupby(['season', 'Location.country'])[id_column].transform('size').astype('int32')
+    elif name == 'drivers':
+        born = pd.to_datetime(data['dateOfBirth'], errors='coerce').dt.year.to_numpy()
+        features['age'] = pd.array(seasons - born, dtype='Int16')
+    return features
+
+class FeatureStore:
+    """Model features computed from the extractor outputs, materialised per season.
+
+    Each season's features are stored at root/<table>/season=YYYY/part-0.parquet
+    together with a fingerprint of the input seasons they were computed from
+    and FEATURE_VERSION. build() only recomputes the seasons whose fingerprint
+    changed, so retraining on refreshed data skips the untouched history.
+    """
+
+    def __init__(self, root='data/features'):
+        self.root = root
+        self.manifest = Manifest(os.path.join(root, 'manifest.json'))
+        self.encodings = Encodings(os.path.join(root, 'encodings.json'))
+
+    def stale_seasons(self, name, data):
+        """Seasons of a raw extractor frame whose stored features are missing or outdated."""
+        fingerprints = season_fingerprints(season_digests(clean(data, name), name), name)
+        return [season for season, fingerprint in fingerprints.items() if not self._is_current(name, season, fingerprint)]
+
+    def _is_current(self, name, season, fingerprint):
+        entry = self.manifest.get(name, season)
+        return (entry is not None and entry.get('fingerprint') == fingerprint
+                and os.path.exists(partition_path(self.root, name, season)))
+
+    def build(self, name, data):
+        """Bring the stored features of one table up to date; returns the seasons recomputed."""
+        data = clean(data, name)
+        fingerprints = season_fingerprints(season_digests(data, name), name)
+        stale = [season for season, fingerprint in fingerprints.items() if not self._is_current(name, season, fingerprint)]
+        if not stale:
+            return []
+
+        for column in ENTITIES[name][1]:
+            self.encodings.update(column, data[column])
+        self.encodings.save()
+
+        # History after the last stale season (plus its target season) cannot affect it
+        features = compute_features(data[data['season'] <= max(stale) + 1], name, self.encodings)
+        stale_set = set(stale)
+        for season, partition in features[features['season'].isin(stale_set)].groupby('season', sort=True):
+            path = partition_path(self.root, name, season)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            partition.to_parquet(f"{path}.tmp", index=False)
+            os.replace(f"{path}.tmp", path)
+            self.manifest.mark_complete(name, season, len(partition), fingerprint=fingerprints[season],
+                                        feature_version=FEATURE_VERSION)
+        self.manifest.save()
+        return stale
+
+    def build_all(self, drivers=None, constructors=None, circuits=None):
+        """Build every table that was given; returns {table: seasons recomputed}."""
+        tables = {'drivers': drivers, 'constructors': constructors, 'circuits': circuits}
+        return {name: self.build(name, data) for name, data in tables.items() if data is not None}
+
+    def load(self, name, seasons=None):
+        """Read the stored features of a table, optionally only some seasons."""
+        stored = sorted(int(season) for season in self.manifest.entries.get(name, {}))
+        if seasons is not None:
+            seasons = set(seasons)
+            stored = [season for season in stored if season in seasons]
+        frames = [pd.read_parquet(partition_path(self.root, name, season)) for season in stored]
+        if not frames:
+            return pd.DataFrame(columns=[ENTITIES[name][0]] + FEATURE_COLUMNS[name] + [TARGET])
+        return pd.concat(frames, ignore_index=True)
+
+    def training_frame(self, name, seasons=None):
+        """Features and target for the rows whose target is known."""
+        features = self.load(name, seasons)
+        labelled = features[features[TARGET].notna()]
+        return labelled[FEATURE_COLUMNS[name]], labelled[TARGET].astype('int8')
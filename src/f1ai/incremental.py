@@ -0,0 +1,190 @@
+# import libraries
+import os
+import json
+import time
+import logging
+import datetime
+import pandas as pd
+from .collectors import collect_frame, write_csv_chunks
+
+logger = logging.getLogger(__name__)
+
+class Manifest:
+    """Small JSON file recording which endpoint/season partitions are complete and when.
+
+    Several refreshers (and processes) share one manifest file, so save()
+    re-reads it and only writes back the seasons this instance changed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = self._read()
+        # (name, season) -> entry, or None for a removed season, not yet saved
+        self._changes = {}
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path) as manifest_file:
+            return json.load(manifest_file)
+
+    def get(self, name, season):
+        return self.entries.get(name, {}).get(str(season))
+
+    def is_fresh(self, name, season, max_age=None):
+        """True if the partition is complete and younger than max_age seconds (None = forever)."""
+        entry = self.get(name, season)
+        if entry is None:
+            return False
+        return max_age is None or time.time() - entry['completed_at'] < max_age
+
+    def mark_complete(self, name, season, rows, completed_at=None, **fields):
+        """Record a finished partition; extra fields (e.g. a fingerprint) are stored alongside."""
+        entry = {
+            'completed_at': completed_at or time.time(),
+            'rows': rows,
+            **fields,
+        }
+        self.entries.setdefault(name, {})[str(season)] = entry
+        self._changes[name, str(season)] = entry
+
+    def remove(self, name, season):
+        """Forget a partition that no longer exists."""
+        self.entries.get(name, {}).pop(str(season), None)
+        self._changes[name, str(season)] = None
+
+    def save(self):
+        """Merge this instance's changes into the file and write it atomically.
+
+        Entries written by other refreshers since the manifest was loaded are
+        kept, and an interrupted run never corrupts the file.
+        """
+        entries = self._read()
+        for (name, season), entry in self._changes.items():
+            if entry is None:
+                entries.get(name, {}).pop(season, None)
+            else:
+                entries.setdefault(name, {})[season] = entry
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(entries, manifest_file, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.entries = entries
+        self._changes = {}
+
+class IncrementalRefresher:
+    """Keep a per-season partitioned copy of an extractor's output up to date.
+
+    Each season lives in its own CSV under data_dir/<name>/, so refreshing one
+    season only rewrites that partition. Finished seasons are fetched once;
+    the current season is refetched when its partition is older than current_ttl.
+    """
+
+    def __init__(self, extractor, name, data_dir='data', manifest=None, current_ttl=24 * 3600):
+        self.extractor = extractor
+        self.name = name
+        self.data_dir = data_dir
+        self.partition_dir = os.path.join(data_dir, name)
+        self.manifest = manifest or Manifest(os.path.join(data_dir, 'manifest.json'))
+        self.current_ttl = current_ttl
+        # Races carry their own season; the other endpoints get a year column added
+        self.season_column = extractor.year_column or 'season'
+
+    def partition_path(self, season):
+        return os.path.join(self.partition_dir, f"season={season}.csv")
+
+    def seed_from_csv(self, filename):
+        """Split an existing combined CSV (e.g. all_drivers_1950_2023.csv) into partitions.
+
+        Seasons already recorded in the manifest are left untouched. Returns the
+        seasons that were seeded.
+        """
+        # Read everything as text so the partitions keep the exact values on disk
+        data = pd.read_csv(filename, dtype=str, keep_default_na=False)
+        completed_at = os.path.getmtime(filename)
+        seeded = []
+        for season, partition in data.groupby(self.season_column, sort=False):
+            if self.manifest.get(self.name, season) is not None:
+                continue
+            self._write_partition(season, partition)
+            self.manifest.mark_complete(self.name, season, len(partition), completed_at)
+            seeded.append(int(season))
+        self.manifest.save()
+        return seeded
+
+    def stale_seasons(self, start_year, end_year):
+        """Return the seasons whose partitions are missing or out of date."""
+        current_year = datetime.date.today().year
+        stale = []
+        for season in range(start_year, end_year + 1):
+            max_age = None if season < current_year else self.current_ttl
+            entry = self.manifest.get(self.name, season)
+            missing = entry is not None and entry['rows'] > 0 and not os.path.exists(self.partition_path(season))
+            if missing or not self.manifest.is_fresh(self.name, season, max_age):
+                stale.append(season)
+        return stale
+
+    def refresh(self, start_year=1950, end_year=2023):
+        """Fetch only missing or stale seasons and store each as its own partition.
+
+        A season with a page that failed to fetch is not stored: its previous
+        partition is kept and it stays stale, so the next refresh retries it.
+        """
+        refreshed, failed = [], []
+        for season in self.stale_seasons(start_year, end_year):
+            failures = self.extractor.failures
+            partition = collect_frame(self.extractor.iter_years_pages(season, season))
+            if self.extractor.failures > failures:
+                failed.append(season)
+                continue
+            self._write_partition(season, partition)
+            self.manifest.mark_complete(self.name, season, len(partition))
+            # Save after every season so an interrupted refresh keeps its progress
+            self.manifest.save()
+            refreshed.append(season)
+        print(f"Refreshed {len(refreshed)} season(s) of {self.name}: {refreshed}")
+        if failed:
+            logger.warning("Failed to fetch %s season(s) of %s, they will be retried: %s", len(failed), self.name, failed)
+        return refreshed
+
+    def iter_partitions(self, start_year=1950, end_year=2023):
+        """Yield the stored partitions in season order."""
+        for season in range(start_year, end_year + 1):
+            path = self.partition_path(season)
+            if os.path.exists(path):
+                yield pd.read_csv(path, dtype=str, keep_default_na=False)
+
+    def load(self, start_year=1950, end_year=2023):
+        """Load the stored partitions of the season range into one DataFrame."""
+        return collect_frame(self.iter_partitions(start_year, end_year))
+
+    def export_csv(self, filename, start_year=1950, end_year=2023):
+        """Rebuild a combined CSV (e.g. all_drivers_1950_2023.csv) from the partitions."""
+        return write_csv_chunks(self.iter_partitions(start_year, end_year), filename)
+
+    def export_columnar(self, root, format='parquet', start_year=1950, end_year=2023):
+        """Write the stored partitions as typed Parquet/Feather files, one per season.
+
+        The refresher's name must be one of the endpoint names in columnar.SCHEMAS.
+        """
+        # pyarrow is only needed for columnar output
+        from .columnar import write_season
+
+        paths = []
+        for partition in self.iter_partitions(start_year, end_year):
+            season = partition[self.season_column].iloc[0]
+            paths.append(write_season(partition, self.name, season, root, format))
+        return paths
+
+    def _write_partition(self, season, partition):
+        path = self.partition_path(season)
+        if partition.empty:
+            # Nothing to store, the manifest still records the season as complete
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        os.makedirs(self.partition_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        partition.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
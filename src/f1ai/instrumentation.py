@@ -0,0 +1,121 @@
+# import libraries
+import re
+import json
+import time
+import threading
+from collections import namedtuple
+
+# Everything measured for one API request
+RequestRecord = namedtuple('RequestRecord', [
+    'endpoint', 'name', 'season', 'url', 'offset', 'status', 'bytes', 'from_cache', 'retries',
+    'started_at', 'latency_s', 'decode_s', 'frame_s', 'rows',
+])
+
+def endpoint_name(endpoint):
+    """Return the table an endpoint serves ("1987/drivers.json" -> "drivers", "2023/5/laps.json" -> "laps",
+    "1987.json" -> "races")."""
+    name = re.sub(r'^\d{4}(?:/\d+)?/?', '', endpoint or '').rsplit('.', 1)[0]
+    return name or 'races'
+
+def endpoint_season(endpoint):
+    """Return the season an endpoint is scoped to ("1987/drivers.json" -> "1987"), or ""."""
+    match = re.match(r'(\d{4})(?:[/.]|$)', endpoint or '')
+    return match.group(1) if match else ''
+
+class Instrumentation:
+    """Collect per-request metrics from the fetch path and export them.
+
+    Hooks are callables that receive every RequestRecord as it is recorded,
+    e.g. to emit tracing spans (started_at and the durations are all there)
+    or to push to another metrics backend.
+    """
+
+    def __init__(self, hooks=None):
+        self.records = []
+        self.hooks = list(hooks or [])
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def record(self, endpoint, url, offset, response, latency_s, decode_s=0.0, frame_s=0.0, rows=0,
+               retries=0, started_at=None):
+        record = RequestRecord(
+            endpoint=endpoint,
+            name=endpoint_name(endpoint),
+            season=endpoint_season(endpoint),
+            url=url,
+            offset=offset,
+            status=response.status_code,
+            bytes=len(response.content),
+            from_cache=getattr(response, 'from_cache', False),
+            retries=retries,
+            started_at=started_at or time.time() - latency_s,
+            latency_s=latency_s,
+            decode_s=decode_s,
+            frame_s=frame_s,
+            rows=rows,
+        )
+        with self._lock:
+            self.records.append(record)
+        for hook in self.hooks:
+            hook(record)
+        return record
+
+    def summary(self, by=('name', 'season')):
+        """Roll the records up per endpoint and season (or any other record fields)."""
+        rollup = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            key = tuple(getattr(record, field) for field in by)
+            totals = rollup.setdefault(key, {
+                'requests': 0, 'errors': 0, 'cache_hits': 0, 'retries': 0, 'bytes': 0, 'rows': 0,
+                'latency_s': 0.0, 'max_latency_s': 0.0, 'decode_s': 0.0, 'frame_s': 0.0,
+            })
+            totals['requests'] += 1
+            totals['errors'] += record.status != 200
+            totals['cache_hits'] += bool(record.from_cache)
+            totals['retries'] += record.retries
+            totals['bytes'] += record.bytes
+            totals['rows'] += record.rows
+            totals['latency_s'] += record.latency_s
+            totals['max_latency_s'] = max(totals['max_latency_s'], record.latency_s)
+            totals['decode_s'] += record.decode_s
+            totals['frame_s'] += record.frame_s
+        return rollup
+
+    def write_json_lines(self, path):
+        """Write one JSON object per request."""
+        with self._lock:
+            records = list(self.records)
+        with open(path, 'w') as output:
+            for record in records:
+                output.write(json.dumps(record._asdict()) + '\n')
+
+    def to_prometheus(self):
+        """Render the per endpoint/season rollup in the Prometheus text format."""
+        metrics = [
+            ('f1ai_requests_total', 'counter', 'Requests made.', 'requests'),
+            ('f1ai_request_errors_total', 'counter', 'Requests that did not return 200.', 'errors'),
+            ('f1ai_cache_hits_total', 'counter', 'Requests served from the response cache.', 'cache_hits'),
+            ('f1ai_request_retries_total', 'counter', 'Retries after 429/5xx responses.', 'retries'),
+            ('f1ai_response_bytes_total', 'counter', 'Response body bytes.', 'bytes'),
+            ('f1ai_rows_total', 'counter', 'Records parsed.', 'rows'),
+            ('f1ai_request_seconds_sum', 'counter', 'Time spent waiting for responses.', 'latency_s'),
+            ('f1ai_request_seconds_max', 'gauge', 'Slowest response.', 'max_latency_s'),
+            ('f1ai_decode_seconds_sum', 'counter', 'Time spent decoding JSON/XML.', 'decode_s'),
+            ('f1ai_frame_seconds_sum', 'counter', 'Time spent building DataFrames.', 'frame_s'),
+        ]
+        rollup = self.summary()
+        lines = []
+        for name, kind, help_text, field in metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (endpoint, season), totals in sorted(rollup.items()):
+                lines.append(f'{name}{{endpoint="{endpoint}",season="{season}"}} {totals[field]}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        with open(path, 'w') as output:
+            output.write(self.to_prometheus())
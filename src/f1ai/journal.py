@@ -0,0 +1,152 @@
+# import libraries
+import time
+import sqlite3
+import zlib
+import threading
+from collections import namedtuple
+from .instrumentation import endpoint_season
+from .response_cache import CachedResponse, season_ttl
+
+# A part of a crawl that is not on disk:
+#   failed     - the request for this offset did not return 200
+#   incomplete - the endpoint stops short of its total from this offset on
+#   missing    - an expected endpoint was never fetched
+Gap = namedtuple('Gap', ['endpoint', 'season', 'offset', 'kind', 'detail'])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    endpoint TEXT NOT NULL,
+    page_offset INTEGER NOT NULL,
+    page_limit INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    http_status INTEGER,
+    next_offset INTEGER,
+    total INTEGER,
+    content BLOB,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (endpoint, page_offset, page_limit)
+)
+"""
+
+class CrawlJournal:
+    """Durable record of every page (endpoint, offset, limit) a crawl has fetched.
+
+    Completed pages are stored with their response body as soon as they are
+    parsed, so a restarted crawl replays them from the journal and only
+    requests what is left. Failed pages are recorded too, and gaps() lists
+    what a crawl is still missing. Completed pages are only replayed while
+    they are younger than ttl (as for ResponseCache, current-season pages
+    expire), and clear() empties the journal once a crawl has no gaps.
+    Backed by SQLite in WAL mode; safe to use from the parallel and async
+    fetch paths.
+    """
+
+    def __init__(self, path, ttl=season_ttl):
+        self.path = path
+        # Either a number of seconds, None (forever) or a callable taking the endpoint
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(SCHEMA)
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _execute(self, sql, parameters=()):
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+            self._connection.commit()
+        return rows
+
+    def get(self, endpoint, offset, limit):
+        """Return the stored response of a completed page, or None if it is missing or expired."""
+        rows = self._execute(
+            "SELECT http_status, content, updated_at FROM units "
+            "WHERE endpoint = ? AND page_offset = ? AND page_limit = ? AND status = 'done'",
+            (endpoint, offset, limit))
+        if not rows:
+            return None
+        ttl = self.ttl(endpoint) if callable(self.ttl) else self.ttl
+        if ttl is not None and rows[0][2] + ttl < time.time():
+            return None
+        response = CachedResponse(endpoint, rows[0][0], zlib.decompress(rows[0][1]))
+        response.from_journal = True
+        return response
+
+    def complete(self, endpoint, offset, limit, page, content):
+        """Record a parsed page together with its response body."""
+        self._execute(
+            "INSERT OR REPLACE INTO units "
+            "(endpoint, page_offset, page_limit, status, http_status, next_offset, total, content, error, updated_at) "
+            "VALUES (?, ?, ?, 'done', 200, ?, ?, ?, NULL, ?)",
+            (endpoint, offset, limit, page.offset + page.limit, page.total, zlib.compress(content), time.time()))
+
+    def fail(self, endpoint, offset, limit, http_status, error=''):
+        """Record a failed page, unless an earlier run already completed it."""
+        self._execute(
+            "INSERT INTO units (endpoint, page_offset, page_limit, status, http_status, error, updated_at) "
+            "VALUES (?, ?, ?, 'failed', ?, ?, ?) "
+            "ON CONFLICT (endpoint, page_offset, page_limit) DO UPDATE SET "
+            "http_status = excluded.http_status, error = excluded.error, updated_at = excluded.updated_at "
+            "WHERE units.status != 'done'",
+            (endpoint, offset, limit, http_status, error, time.time()))
+
+    def clear(self):
+        """Forget every journaled page, e.g. once a crawl has completed without gaps."""
+        self._execute("DELETE FROM units")
+
+    def summary(self):
+        """Count the journaled pages by status."""
+        return dict(self._execute("SELECT status, COUNT(*) FROM units GROUP BY status"))
+
+    def gaps(self, endpoints=None):
+        """List the failed, incomplete and (given the expected endpoints) missing parts of the crawl."""
+        rows = self._execute(
+            "SELECT endpoint, page_offset, page_limit, status, http_status, next_offset, total, error FROM units "
+            "ORDER BY endpoint, page_limit, page_offset")
+        units = {}
+        for endpoint, offset, limit, status, http_status, next_offset, total, error in rows:
+            units.setdefault((endpoint, limit), {})[offset] = (status, http_status, next_offset, total, error)
+
+        gaps = []
+        for (endpoint, limit), pages in units.items():
+            done = {offset: unit for offset, unit in pages.items() if unit[0] == 'done'}
+            for offset, (status, http_status, _, _, error) in pages.items():
+                if status == 'failed':
+                    gaps.append(Gap(endpoint, endpoint_season(endpoint), offset, 'failed',
+                                    f"HTTP {http_status}: {error or ''}".strip()))
+            if not done:
+                continue
+            # Walk the completed pages from offset 0 until the chain breaks or reaches the total
+            total = max(unit[3] for unit in done.values())
+            offset = 0
+            while offset < total and offset in done:
+                offset = done[offset][2]
+            if offset < total and offset not in pages:
+                gaps.append(Gap(endpoint, endpoint_season(endpoint), offset, 'incomplete',
+                                f"rows {offset}-{total} not fetched"))
+
+        fetched = {endpoint for endpoint, _ in units}
+        for endpoint in endpoints or []:
+            if endpoint not in fetched:
+                gaps.append(Gap(endpoint, endpoint_season(endpoint), 0, 'missing', "never fetched"))
+        return gaps
+
+    def report(self, endpoints=None):
+        """Human readable gap report, one line per gap."""
+        gaps = self.gaps(endpoints)
+        if not gaps:
+            return "No gaps: every journaled endpoint is complete"
+        lines = [f"{len(gaps)} gap(s):"]
+        lines.extend(f"  {gap.kind:<10} {gap.endpoint} offset {gap.offset}: {gap.detail}" for gap in gaps)
+        return '\n'.join(lines)
@@ -0,0 +1,198 @@
+# import libraries
+import numpy as np
+import pandas as pd
+from .columnar import SEASON_COLUMNS
+
+try:
+    # Optional ball tree for the spatial queries; a vectorised haversine scan is used without it
+    from sklearn.neighbors import BallTree
+except ImportError:
+    BallTree = None
+
+EARTH_RADIUS_KM = 6371.0088
+
+def haversine_km(lat, long, lats, longs):
+    """Great-circle distance in km from one point to arrays of points (all in degrees)."""
+    lat, long, lats, longs = map(np.radians, (lat, long, lats, longs))
+    a = np.sin((lats - lat) / 2) ** 2 + np.cos(lat) * np.cos(lats) * np.sin((longs - long) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+def hash_index(frame, column):
+    """Map every value of a column to the positions of its rows."""
+    if column not in frame.columns:
+        return {}
+    return {key: positions for key, positions in frame.groupby(column, sort=False, observed=True).indices.items()}
+
+class LookupStore:
+    """Indexed, read-only lookups over the extractor outputs.
+
+    Built once from the wide per-season frames (any can be omitted):
+    hash indexes on driverId/constructorId/circuitId/season, a sorted
+    (season, round) index over the race schedule for range queries and a
+    haversine ball tree over the circuit locations.
+    """
+
+    def __init__(self, drivers=None, constructors=None, circuits=None, races=None):
+        empty = pd.DataFrame()
+        self.drivers = drivers.reset_index(drop=True) if drivers is not None else empty
+        self.constructors = constructors.reset_index(drop=True) if constructors is not None else empty
+        self.circuits = circuits.reset_index(drop=True) if circuits is not None else empty
+        self.races = empty
+        self._race_keys = np.empty(0, dtype='int64')
+        if races is not None:
+            # Keep the schedule sorted by (season, round) so ranges are contiguous slices
+            self.races = races.sort_values(['season', 'round'], kind='stable').reset_index(drop=True)
+            self._race_keys = self._race_key(self.races['season'].to_numpy(), self.races['round'].to_numpy())
+
+        self.indexes = {
+            'drivers': {'driverId': hash_index(self.drivers, 'driverId'),
+                        'season': hash_index(self.drivers, SEASON_COLUMNS['drivers'])},
+            'constructors': {'constructorId': hash_index(self.constructors, 'constructorId'),
+                             'season': hash_index(self.constructors, SEASON_COLUMNS['constructors'])},
+            'circuits': {'circuitId': hash_index(self.circuits, 'circuitId'),
+                         'season': hash_index(self.circuits, SEASON_COLUMNS['circuits'])},
+            'races': {'circuitId': hash_index(self.races, 'Circuit.circuitId'),
+                      'season': hash_index(self.races, 'season')},
+        }
+        # Row lookups are memoised; the store is read-only so a frame can be handed out repeatedly
+        self._frames = {}
+        self._build_locations()
+
+    @classmethod
+    def from_csv(cls, drivers=None, constructors=None, circuits=None, races=None):
+        """Build a store from CSV files written by the extractors."""
+        read = lambda path: pd.read_csv(path) if path is not None else None
+        return cls(read(drivers), read(constructors), read(circuits), read(races))
+
+    @staticmethod
+    def _race_key(seasons, rounds):
+        return np.asarray(seasons, dtype='int64') * 1000 + np.asarray(rounds, dtype='int64')
+
+    def _rows(self, table, column, value):
+        key = (table, column, value)
+        if key not in self._frames:
+            positions = self.indexes[table][column].get(value, [])
+            self._frames[key] = getattr(self, table).iloc[positions]
+        return self._frames[key]
+
+    def _seasons(self, table, column, value, season_column):
+        """Sorted distinct seasons of the rows matching value, without building a frame."""
+        positions = self.indexes[table][column].get(value)
+        if positions is None:
+            return []
+        seasons = getattr(self, table)[season_column].to_numpy()[positions]
+        return np.unique(seasons.astype('int64')).tolist()
+
+    def _build_locations(self):
+        """One location per circuit, from the circuits table and the circuits embedded in races."""
+        frames = []
+        if {'circuitId', 'Location.lat', 'Location.long'} <= set(self.circuits.columns):
+            frames.append(self.circuits)
+        if 'Circuit.circuitId' in self.races.columns:
+            frames.append(self.races.filter(like='Circuit.').rename(columns=lambda column: column[len('Circuit.'):]))
+        if not frames:
+            self.locations = pd.DataFrame(columns=['circuitId', 'circuitName', 'Location.lat', 'Location.long'])
+        else:
+            locations = pd.concat(frames, ignore_index=True).drop_duplicates('circuitId', keep='last')
+            columns = [column for column in locations.columns if column in ('circuitId', 'circuitName') or column.startswith('Location.')]
+            self.locations = locations[columns].dropna(subset=['Location.lat', 'Location.long']).reset_index(drop=True)
+        self._coordinates = self.locations[['Location.lat', 'Location.long']].to_numpy(dtype='float64')
+        # Plain arrays: building a result frame from them is cheaper than slicing self.locations
+        self._location_columns = {column: self.locations[column].array for column in self.locations.columns}
+        self._location_index = {circuit_id: position for position, circuit_id in enumerate(self.locations['circuitId'])}
+        self._tree = None
+        if BallTree is not None and len(self._coordinates):
+            self._tree = BallTree(np.radians(self._coordinates), metric='haversine')
+
+    # Drivers and constructors
+
+    def driver(self, driver_id):
+        """Rows for a driver, one per season."""
+        return self._rows('drivers', 'driverId', driver_id)
+
+    def driver_seasons(self, driver_id):
+        return self._seasons('drivers', 'driverId', driver_id, SEASON_COLUMNS['drivers'])
+
+    def drivers_in_season(self, season):
+        return self._rows('drivers', 'season', season)
+
+    def constructor(self, constructor_id):
+        """Rows for a constructor, one per season."""
+        return self._rows('constructors', 'constructorId', constructor_id)
+
+    def constructor_seasons(self, constructor_id):
+        return self._seasons('constructors', 'constructorId', constructor_id, SEASON_COLUMNS['constructors'])
+
+    def constructors_in_season(self, season):
+        return self._rows('constructors', 'season', season)
+
+    # Circuits and races
+
+    def circuit_seasons(self, circuit_id):
+        """Seasons a circuit hosted a race."""
+        if 'Circuit.circuitId' in self.races.columns:
+            return self._seasons('races', 'circuitId', circuit_id, 'season')
+        return self._seasons('circuits', 'circuitId', circuit_id, SEASON_COLUMNS['circuits'])
+
+    def circuits_in_season(self, season):
+        return self._rows('circuits', 'season', season)
+
+    def races_at_circuit(self, circuit_id):
+        return self._rows('races', 'circuitId', circuit_id)
+
+    def races_in_season(self, season):
+        return self._rows('races', 'season', season)
+
+    def race(self, season, round):
+        """The race for a (season, round), or None."""
+        key = self._race_key(season, round)
+        position = np.searchsorted(self._race_keys, key)
+        if position < len(self._race_keys) and self._race_keys[position] == key:
+            return self.races.iloc[position]
+        return None
+
+    def races_between(self, start_season, end_season, start_round=1, end_round=999):
+        """Races from (start_season, start_round) to (end_season, end_round) inclusive, in order."""
+        low = np.searchsorted(self._race_keys, self._race_key(start_season, start_round), side='left')
+        high = np.searchsorted(self._race_keys, self._race_key(end_season, end_round), side='right')
+        return self.races.iloc[low:high]
+
+    # Spatial queries
+
+    def _point(self, circuit_id=None, lat=None, long=None):
+        if circuit_id is not None:
+            if circuit_id not in self._location_index:
+                raise KeyError(f"Unknown circuit: {circuit_id}")
+            return self._coordinates[self._location_index[circuit_id]]
+        if lat is None or long is None:
+            raise ValueError("Pass a circuit_id or both lat and long")
+        return np.array([lat, long], dtype='float64')
+
+    def _located(self, positions, distances):
+        order = np.argsort(distances, kind='stable')
+        positions = np.asarray(positions)[order]
+        columns = {column: values.take(positions) for column, values in self._location_columns.items()}
+        columns['distance_km'] = np.asarray(distances)[order]
+        return pd.DataFrame(columns, index=positions, copy=False)
+
+    def circuits_within(self, radius_km, circuit_id=None, lat=None, long=None):
+        """Circuits within radius_km of a circuit or a point, nearest first, with a distance_km column."""
+        point = self._point(circuit_id, lat, long)
+        if self._tree is not None:
+            positions, distances = self._tree.query_radius(np.radians([point]), r=radius_km / EARTH_RADIUS_KM,
+                                                           return_distance=True)
+            return self._located(positions[0], distances[0] * EARTH_RADIUS_KM)
+        distances = haversine_km(point[0], point[1], self._coordinates[:, 0], self._coordinates[:, 1])
+        positions = np.flatnonzero(distances <= radius_km)
+        return self._located(positions, distances[positions])
+
+    def nearest_circuits(self, k=5, circuit_id=None, lat=None, long=None):
+        """The k circuits closest to a circuit or a point (a circuit is its own nearest neighbour)."""
+        point = self._point(circuit_id, lat, long)
+        k = min(k, len(self._coordinates))
+        if self._tree is not None:
+            distances, positions = self._tree.query(np.radians([point]), k=k)
+            return self._located(positions[0], distances[0] * EARTH_RADIUS_KM)
+        distances = haversine_km(point[0], point[1], self._coordinates[:, 0], self._coordinates[:, 1])
+        positions = np.argsort(distances, kind='stable')[:k]
+        return self._located(positions, distances[positions])
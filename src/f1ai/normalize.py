@@ -0,0 +1,148 @@
+# import libraries
+import os
+import numpy as np
+import pandas as pd
+from .columnar import SEASON_COLUMNS, apply_schema
+
+# Entity -> (natural id column, surrogate key column)
+DIMENSIONS = {
+    'drivers': ('driverId', 'driver_key'),
+    'constructors': ('constructorId', 'constructor_key'),
+    'circuits': ('circuitId', 'circuit_key'),
+}
+TABLES = ['drivers', 'constructors', 'circuits', 'driver_seasons', 'constructor_seasons', 'circuit_seasons', 'races']
+
+def build_dimension(wide, name):
+    """One row per entity with an int32 surrogate key, typed with the endpoint schema.
+
+    Ergast returns the same entity record for every season, so the latest
+    season's copy is kept and nothing is lost.
+    """
+    id_column, key_column = DIMENSIONS[name]
+    season_column = SEASON_COLUMNS[name]
+    dimension = wide
+    if season_column in wide.columns:
+        dimension = wide.sort_values(season_column, kind='stable').drop(columns=[season_column])
+    dimension = dimension.drop_duplicates(id_column, keep='last').sort_values(id_column).reset_index(drop=True)
+    dimension = apply_schema(dimension, name)
+    dimension.insert(0, key_column, np.arange(len(dimension), dtype='int32'))
+    return dimension
+
+def surrogate_keys(dimension, name, ids):
+    """Map natural ids to the dimension's integer keys."""
+    id_column, key_column = DIMENSIONS[name]
+    positions = pd.Index(dimension[id_column].astype(str)).get_indexer(ids.astype(str))
+    return dimension[key_column].to_numpy()[positions]
+
+def build_membership(wide, dimension, name):
+    """Compact (key, season) table recording which seasons each entity appeared in."""
+    key_column = DIMENSIONS[name][1]
+    membership = pd.DataFrame({
+        key_column: surrogate_keys(dimension, name, wide[DIMENSIONS[name][0]]),
+        'season': wide[SEASON_COLUMNS[name]].astype('int16').to_numpy(),
+    })
+    return membership.drop_duplicates().sort_values(['season', key_column]).reset_index(drop=True)
+
+class NormalizedData:
+    """Dimension tables (drivers, constructors, circuits) plus season-membership and race facts.
+
+    Every entity attribute is stored once, facts refer to entities by int32
+    keys and repeated strings are categorical. The wide_* methods rebuild
+    the per-season views the extractors produce.
+    """
+
+    def __init__(self, **tables):
+        unknown = set(tables) - set(TABLES)
+        if unknown:
+            raise ValueError(f"Unknown tables: {sorted(unknown)}")
+        self.tables = tables
+
+    def __getattr__(self, name):
+        tables = self.__dict__.get('tables', {})
+        if name in tables:
+            return tables[name]
+        raise AttributeError(name)
+
+    def memory_usage(self):
+        """Bytes used by each table."""
+        return {name: int(table.memory_usage(deep=True).sum()) for name, table in self.tables.items()}
+
+    def save(self, directory):
+        """Write every table as a Parquet file in directory."""
+        os.makedirs(directory, exist_ok=True)
+        for name, table in self.tables.items():
+            table.to_parquet(os.path.join(directory, f"{name}.parquet"), index=False)
+
+    @classmethod
+    def load(cls, directory):
+        tables = {}
+        for name in TABLES:
+            path = os.path.join(directory, f"{name}.parquet")
+            if os.path.exists(path):
+                tables[name] = pd.read_parquet(path)
+        return cls(**tables)
+
+    def wide_view(self, name):
+        """Rebuild the per-season drivers, constructors or circuits table.
+
+        The rows and values match the extractor output, but the values are
+        typed with the endpoint schema (e.g. permanentNumber is Int16, dates
+        are datetimes), so a CSV written from the view is not byte-identical
+        to the original. The season column comes last, whereas the drivers
+        CSV has it before code and permanentNumber.
+        """
+        key_column = DIMENSIONS[name][1]
+        membership = self.tables[f"{name[:-1]}_seasons"]
+        wide = membership.merge(self.tables[name], on=key_column, how='left', sort=False)
+        wide = wide.drop(columns=[key_column]).rename(columns={'season': SEASON_COLUMNS[name]})
+        # The dimension's columns, then the season
+        columns = [column for column in wide.columns if column != SEASON_COLUMNS[name]]
+        return wide[columns + [SEASON_COLUMNS[name]]]
+
+    def wide_drivers(self):
+        return self.wide_view('drivers')
+
+    def wide_constructors(self):
+        return self.wide_view('constructors')
+
+    def wide_circuits(self):
+        return self.wide_view('circuits')
+
+    def wide_races(self):
+        """Rebuild the race schedule with the full circuit record embedded in each row."""
+        circuits = self.tables['circuits'].add_prefix('Circuit.').rename(columns={'Circuit.circuit_key': 'circuit_key'})
+        races = self.tables['races'].merge(circuits, on='circuit_key', how='left', sort=False)
+        return races.drop(columns=['circuit_key'])
+
+def normalize(drivers=None, constructors=None, circuits=None, races=None):
+    """Split the extractor outputs into dimension, membership and fact tables.
+
+    Takes the wide per-season frames (e.g. all_drivers_1950_2023.csv and
+    all_race_schedule_data.csv); any of them can be omitted.
+    """
+    tables = {}
+    for name, wide in (('drivers', drivers), ('constructors', constructors)):
+        if wide is not None:
+            tables[name] = build_dimension(wide, name)
+            tables[f"{name[:-1]}_seasons"] = build_membership(wide, tables[name], name)
+
+    # Circuits come from the circuits endpoint and from the circuit embedded in each race
+    circuit_frames = []
+    if circuits is not None:
+        circuit_frames.append(circuits)
+    if races is not None:
+        race_circuits = races.filter(like='Circuit.').rename(columns=lambda column: column[len('Circuit.'):])
+        circuit_frames.append(race_circuits.assign(Year=races['season'].to_numpy()))
+    if circuit_frames:
+        tables['circuits'] = build_dimension(pd.concat(circuit_frames, ignore_index=True), 'circuits')
+    if circuits is not None:
+        tables['circuit_seasons'] = build_membership(circuits, tables['circuits'], 'circuits')
+
+    if races is not None:
+        race_facts = apply_schema(races, 'races')
+        circuit_keys = surrogate_keys(tables['circuits'], 'circuits', races['Circuit.circuitId'])
+        race_facts = race_facts.drop(columns=[column for column in race_facts.columns if column.startswith('Circuit.')])
+        race_facts.insert(2, 'circuit_key', circuit_keys)
+        tables['races'] = race_facts
+
+    return NormalizedData(**tables)
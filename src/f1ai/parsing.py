@@ -0,0 +1,91 @@
+# import libraries
+import io
+import json
+from collections import namedtuple
+import xml.etree.ElementTree as ET
+
+try:
+    # Optional fast JSON backend; the standard library is used when it is not installed
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# One decoded page: the table's records plus the pagination fields of MRData
+Page = namedtuple('Page', ['records', 'limit', 'offset', 'total'])
+
+def decode_page(content, format, table_path):
+    """Decode a response body exactly once into a Page.
+
+    table_path is the JSON path to the records, e.g.
+    ('MRData', 'DriverTable', 'Drivers'). The XML backend does not use it:
+    its records are always the rows of the single table element under MRData.
+    """
+    if format == 'json':
+        return decode_json(content, table_path)
+    elif format == 'xml':
+        return decode_xml(content)
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+def decode_json(content, table_path):
+    data = json_loads(content)
+    mr_data = data.get(table_path[0], {})
+    records = mr_data
+    for key in table_path[1:]:
+        records = records.get(key, {})
+    return Page(
+        records=records or [],
+        limit=int(mr_data.get('limit', 0)),
+        offset=int(mr_data.get('offset', 0)),
+        total=int(mr_data.get('total', 0)),
+    )
+
+def decode_xml(content):
+    """Stream an Ergast XML document with iterparse, building one record per table row.
+
+    Records are shaped like the JSON API's (nested elements stay nested,
+    leaf elements get camelCase keys), so both formats normalize to the same columns.
+    """
+    records = []
+    attrib = {}
+    depth = 0
+    for event, element in ET.iterparse(io.BytesIO(content), events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 1:
+                # The MRData root carries limit, offset and total
+                attrib = dict(element.attrib)
+            continue
+        if depth == 3:
+            # MRData > *Table > row
+            records.append(_xml_record(element))
+            element.clear()
+        depth -= 1
+    return Page(
+        records=records,
+        limit=int(attrib.get('limit', 30)),
+        offset=int(attrib.get('offset', 0)),
+        total=int(attrib.get('total', 0)),
+    )
+
+def _xml_record(element):
+    record = dict(element.attrib)
+    text = (element.text or '').strip()
+    if text and len(element) == 0:
+        # e.g. <Season url="...">1950</Season> or <Time millis="...">1:34:50.616</Time>
+        record[_json_key(element.tag)] = text
+    for child in element:
+        if len(child) or child.attrib:
+            record[_local_name(child.tag)] = _xml_record(child)
+        else:
+            record[_json_key(child.tag)] = child.text
+    return record
+
+def _local_name(tag):
+    # Drop the {http://ergast.com/mrd/1.5} namespace
+    return tag.rsplit('}', 1)[-1]
+
+def _json_key(tag):
+    name = _local_name(tag)
+    return name[:1].lower() + name[1:]
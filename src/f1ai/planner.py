@@ -0,0 +1,77 @@
+# import libraries
+import math
+from collections import namedtuple
+from .collectors import collect_frame
+
+# Largest page size the Ergast API accepts
+MAX_PAGE_SIZE = 1000
+
+# How each endpoint can be queried:
+#   all          - unfiltered query over every season
+#   per_year     - query scoped to one season
+#   season_field - record field holding the season, if the records expose it
+#   total_rows   - rough size of the unfiltered table, used to estimate its cost
+ENDPOINTS = {
+    'races': {'all': 'races.{format}', 'per_year': '{year}.{format}', 'season_field': 'season', 'total_rows': 1200},
+    'seasons': {'all': 'seasons.{format}', 'per_year': None, 'season_field': 'season', 'total_rows': 80},
+    'drivers': {'all': 'drivers.{format}', 'per_year': '{year}/drivers.{format}', 'season_field': None},
+    'constructors': {'all': 'constructors.{format}', 'per_year': '{year}/constructors.{format}', 'season_field': None},
+    'circuits': {'all': 'circuits.{format}', 'per_year': '{year}/circuits.{format}', 'season_field': None},
+}
+
+# One API query: the endpoint to page through, the seasons to keep from an
+# unfiltered query (None keeps everything) and the season to stamp on per-year records
+Query = namedtuple('Query', ['endpoint', 'seasons', 'year'])
+QueryPlan = namedtuple('QueryPlan', ['name', 'queries', 'page_size', 'estimated_requests'])
+
+class RequestPlanner:
+    """Pick the query plan that needs the fewest API round trips.
+
+    Every query uses the largest allowed page size. When an endpoint's
+    records carry their season, a multi-season range is served by one
+    unfiltered query filtered client-side instead of one query per year.
+    The resulting tables match fetch_all_years_data for the same range.
+    """
+
+    def __init__(self, page_size=MAX_PAGE_SIZE, format='json'):
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+        self.format = format
+
+    def plan(self, name, seasons):
+        """Plan the queries for an endpoint and an iterable of seasons."""
+        spec = ENDPOINTS[name]
+        # Deduplicate and order the seasons so overlapping ranges are fetched once
+        seasons = sorted(set(seasons))
+        unfiltered_cost = math.ceil(spec.get('total_rows', 0) / self.page_size)
+
+        if spec['season_field'] is not None and (spec['per_year'] is None or unfiltered_cost < len(seasons)):
+            query = Query(spec['all'].format(format=self.format), frozenset(seasons), None)
+            return QueryPlan(name, [query], self.page_size, max(unfiltered_cost, 1))
+
+        queries = [Query(spec['per_year'].format(year=year, format=self.format), None, year) for year in seasons]
+        return QueryPlan(name, queries, self.page_size, len(queries))
+
+    def plan_ranges(self, name, ranges):
+        """Plan several (start_year, end_year) ranges of one endpoint as a single deduplicated plan."""
+        seasons = set()
+        for start_year, end_year in ranges:
+            seasons.update(range(start_year, end_year + 1))
+        return self.plan(name, seasons)
+
+    def iter_pages(self, plan, extractor):
+        """Yield the pages of a plan, shaped like extractor.iter_years_pages would yield them."""
+        season_field = ENDPOINTS[plan.name]['season_field']
+        for query in plan.queries:
+            record_filter = None
+            if query.seasons is not None:
+                # Filter raw records so the columns match what per-year queries would return
+                record_filter = lambda record, seasons=query.seasons: int(record[season_field]) in seasons
+            pages = extractor.iter_pages(query.endpoint, self.format, limit=plan.page_size, record_filter=record_filter)
+            for page in pages:
+                if query.year is not None and extractor.year_column is not None:
+                    page[extractor.year_column] = query.year  # Add a column for the year
+                yield page
+
+    def execute(self, plan, extractor):
+        """Run a plan and return its rows as one DataFrame."""
+        return collect_frame(self.iter_pages(plan, extractor))
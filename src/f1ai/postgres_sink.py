@@ -0,0 +1,183 @@
+# import libraries
+import io
+import os
+import itertools
+import pandas as pd
+import psycopg2
+from .columnar import SEASON_COLUMNS, apply_schema
+
+# Target table per endpoint: (DataFrame column, SQL column, SQL type) and the natural key
+TABLES = {
+    'circuits': {
+        'table': 'circuits',
+        'columns': [
+            ('circuitId', 'circuit_id', 'TEXT'),
+            ('url', 'url', 'TEXT'),
+            ('circuitName', 'circuit_name', 'TEXT'),
+            ('Location.lat', 'latitude', 'DOUBLE PRECISION'),
+            ('Location.long', 'longitude', 'DOUBLE PRECISION'),
+            ('Location.locality', 'locality', 'TEXT'),
+            ('Location.country', 'country', 'TEXT'),
+        ],
+        'key': ['circuit_id'],
+    },
+    'drivers': {
+        'table': 'driver_seasons',
+        'columns': [
+            ('driverId', 'driver_id', 'TEXT'),
+            ('year', 'season', 'SMALLINT'),
+            ('url', 'url', 'TEXT'),
+            ('givenName', 'given_name', 'TEXT'),
+            ('familyName', 'family_name', 'TEXT'),
+            ('dateOfBirth', 'date_of_birth', 'DATE'),
+            ('nationality', 'nationality', 'TEXT'),
+            ('code', 'code', 'TEXT'),
+            ('permanentNumber', 'permanent_number', 'SMALLINT'),
+        ],
+        'key': ['driver_id', 'season'],
+    },
+    'constructors': {
+        'table': 'constructor_seasons',
+        'columns': [
+            ('constructorId', 'constructor_id', 'TEXT'),
+            ('year', 'season', 'SMALLINT'),
+            ('url', 'url', 'TEXT'),
+            ('name', 'name', 'TEXT'),
+            ('nationality', 'nationality', 'TEXT'),
+        ],
+        'key': ['constructor_id', 'season'],
+    },
+    'races': {
+        'table': 'races',
+        'columns': [
+            ('season', 'season', 'SMALLINT'),
+            ('round', 'round', 'SMALLINT'),
+            ('url', 'url', 'TEXT'),
+            ('raceName', 'race_name', 'TEXT'),
+            ('date', 'date', 'DATE'),
+            ('time', 'time', 'TEXT'),
+            ('Circuit.circuitId', 'circuit_id', 'TEXT'),
+            ('FirstPractice.date', 'first_practice_date', 'DATE'),
+            ('FirstPractice.time', 'first_practice_time', 'TEXT'),
+            ('SecondPractice.date', 'second_practice_date', 'DATE'),
+            ('SecondPractice.time', 'second_practice_time', 'TEXT'),
+            ('ThirdPractice.date', 'third_practice_date', 'DATE'),
+            ('ThirdPractice.time', 'third_practice_time', 'TEXT'),
+            ('Qualifying.date', 'qualifying_date', 'DATE'),
+            ('Qualifying.time', 'qualifying_time', 'TEXT'),
+            ('Sprint.date', 'sprint_date', 'DATE'),
+            ('Sprint.time', 'sprint_time', 'TEXT'),
+        ],
+        'key': ['season', 'round'],
+    },
+    'seasons': {
+        'table': 'seasons',
+        'columns': [
+            ('season', 'season', 'SMALLINT'),
+            ('url', 'url', 'TEXT'),
+        ],
+        'key': ['season'],
+    },
+}
+
+class PostgresSink:
+    """Bulk load extractor outputs into PostgreSQL with COPY and idempotent upserts.
+
+    Rows are streamed into a temporary staging table with COPY FROM STDIN in
+    batches of batch_rows, then merged into the target table with
+    INSERT ... ON CONFLICT on the endpoint's natural key, so reloading the
+    same data never creates duplicates.
+    """
+
+    def __init__(self, dsn=None, connection=None, batch_rows=50000):
+        # Fall back to DATABASE_URL so scripts can be configured from the environment
+        self.connection = connection or psycopg2.connect(dsn or os.environ['DATABASE_URL'])
+        self.batch_rows = batch_rows
+
+    def create_tables(self):
+        """Create the target tables if they do not exist yet."""
+        with self.connection, self.connection.cursor() as cursor:
+            for spec in TABLES.values():
+                columns = ', '.join(f"{sql_column} {sql_type}" for _, sql_column, sql_type in spec['columns'])
+                key = ', '.join(spec['key'])
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS {spec['table']} ({columns}, PRIMARY KEY ({key}))")
+
+    def load(self, data, name):
+        """Load a whole DataFrame in a single transaction; returns the number of rows staged."""
+        batches = (data.iloc[start:start + self.batch_rows] for start in range(0, len(data), self.batch_rows))
+        return self._load_batches(batches, name)
+
+    def load_by_season(self, data, name):
+        """Load a DataFrame with one transaction per season; returns {season: rows}."""
+        loaded = {}
+        for season, partition in data.groupby(SEASON_COLUMNS[name], sort=True):
+            loaded[season] = self.load(partition, name)
+        return loaded
+
+    def load_records(self, records, name, season=None):
+        """Load an iterator of records (e.g. extractor.iter_records) in a single transaction.
+
+        Records of a per-season endpoint do not carry their season: pass the
+        season the records belong to for drivers and constructors, or load the
+        pages of extractor.iter_years_pages with load_pages instead.
+        """
+        return self._load_batches(self._record_batches(iter(records), name, season), name)
+
+    def load_pages(self, pages, name):
+        """Load an iterator of page DataFrames (e.g. extractor.iter_years_pages) in a single transaction."""
+        return self._load_batches((page for page in pages if not page.empty), name)
+
+    def _record_batches(self, records, name, season=None):
+        while True:
+            batch = list(itertools.islice(records, self.batch_rows))
+            if not batch:
+                return
+            batch = pd.json_normalize(batch)
+            if season is not None:
+                batch[SEASON_COLUMNS[name]] = season
+            yield batch
+
+    def _load_batches(self, batches, name):
+        spec = TABLES[name]
+        staging = f"staging_{spec['table']}"
+        sql_columns = ', '.join(sql_column for _, sql_column, _ in spec['columns'])
+        rows = 0
+
+        with self.connection, self.connection.cursor() as cursor:
+            # _row keeps the arrival order so the newest duplicate wins the merge
+            cursor.execute(f"CREATE TEMP TABLE {staging} (LIKE {spec['table']}) ON COMMIT DROP")
+            cursor.execute(f"ALTER TABLE {staging} ADD COLUMN _row BIGSERIAL")
+            for batch in batches:
+                cursor.copy_expert(
+                    f"COPY {staging} ({sql_columns}) FROM STDIN WITH (FORMAT csv, NULL '')",
+                    self._to_csv_buffer(batch, name),
+                )
+                rows += len(batch)
+            cursor.execute(self._merge_sql(spec, staging))
+        return rows
+
+    def _to_csv_buffer(self, batch, name):
+        spec = TABLES[name]
+        frame_columns = [frame_column for frame_column, _, _ in spec['columns']]
+        # Typed columns keep integers as "44" rather than "44.0" and dates as ISO strings
+        batch = apply_schema(batch.reindex(columns=frame_columns), name)
+        # The staging table keeps the key's NOT NULL, so fail with the cause rather than a COPY error
+        missing = [frame_column for frame_column, sql_column, _ in spec['columns']
+                   if sql_column in spec['key'] and batch[frame_column].isna().any()]
+        if missing:
+            raise ValueError(f"{name} rows without {', '.join(missing)}; load per-season pages or pass season=")
+        buffer = io.StringIO()
+        batch.to_csv(buffer, index=False, header=False, date_format='%Y-%m-%d')
+        buffer.seek(0)
+        return buffer
+
+    def _merge_sql(self, spec, staging):
+        columns = [sql_column for _, sql_column, _ in spec['columns']]
+        key = ', '.join(spec['key'])
+        updates = ', '.join(f"{column} = EXCLUDED.{column}" for column in columns if column not in spec['key'])
+        return (
+            f"INSERT INTO {spec['table']} ({', '.join(columns)}) "
+            f"SELECT DISTINCT ON ({key}) {', '.join(columns)} FROM {staging} "
+            f"ORDER BY {key}, _row DESC "
+            f"ON CONFLICT ({key}) DO UPDATE SET {updates}"
+        )
@@ -0,0 +1,144 @@
+# import libraries
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import joblib
+from .features import ALIASES, ENTITIES, FEATURE_VERSION, TARGET, Encodings
+
+# Batches with fewer uncached rows than this are scored in-process
+PARALLEL_MIN_ROWS = 50000
+
+def train_model(store, name, path, seasons=None, n_estimators=100, random_state=42):
+    """Fit the presence model on a feature store table and save it with its encodings."""
+    from sklearn.ensemble import RandomForestClassifier
+
+    features, target = store.training_frame(name, seasons)
+    model = RandomForestClassifier(n_estimators=n_estimators, random_state=random_state)
+    model.fit(features.to_numpy(dtype='float64', na_value=-1), target.to_numpy())
+    bundle = {
+        'model': model,
+        'name': name,
+        'feature_columns': list(features.columns),
+        'vocabularies': {column: store.encodings.vocabularies.get(column, []) for column in ENTITIES[name][1]},
+        'feature_version': FEATURE_VERSION,
+        'trained_rows': len(features),
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    joblib.dump(bundle, path)
+    print(f"Model saved to {path}")
+    return bundle
+
+def next_season_scenarios(store, name, season=None):
+    """One scenario per entity of the latest stored season (or season - 1), scored for the following season."""
+    features = store.load(name)
+    latest = features['season'].max() if season is None else season - 1
+    return features[features['season'] == latest].reset_index(drop=True)
+
+# Model bundle loaded once per pool worker by _init_worker
+_worker_bundle = None
+
+def _init_worker(path):
+    global _worker_bundle
+    _worker_bundle = joblib.load(path)
+    _worker_bundle['model'].n_jobs = 1
+
+def _score_chunk(matrix):
+    return _worker_bundle['model'].predict_proba(matrix)[:, 1]
+
+class PredictionService:
+    """Score batches of scenarios with a persisted model kept warm in memory.
+
+    The bundle written by train_model is loaded once. Scenarios are frames
+    with the model's feature columns; categorical columns may hold the raw
+    values ("UK", "Monaco"), which are encoded with the codes the model was
+    trained with. Identical scenarios are scored once: probabilities are
+    cached by a hash of the encoded row. Large batches are split across a
+    process pool whose workers each load the model once, in the initializer.
+    """
+
+    def __init__(self, path, workers=None, cache_size=1_000_000, parallel_min_rows=PARALLEL_MIN_ROWS):
+        self.path = path
+        self.bundle = joblib.load(path)
+        if self.bundle['feature_version'] != FEATURE_VERSION:
+            raise ValueError(f"{path} was trained on feature version {self.bundle['feature_version']}, "
+                             f"current is {FEATURE_VERSION}; retrain the model")
+        self.model = self.bundle['model']
+        self.feature_columns = self.bundle['feature_columns']
+        self.encodings = Encodings()
+        self.encodings.vocabularies = self.bundle['vocabularies']
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.cache_size = cache_size
+        self.parallel_min_rows = parallel_min_rows
+        self.cache = OrderedDict()
+        self.cache_hits = 0
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def encode(self, scenarios):
+        """Return the model's feature matrix for a frame of scenarios."""
+        scenarios = pd.DataFrame(scenarios)
+        missing = [column for column in self.feature_columns if column not in scenarios.columns]
+        if missing:
+            raise ValueError(f"Scenarios are missing feature columns: {missing}")
+        encoded = {}
+        for column in self.feature_columns:
+            values = scenarios[column]
+            if column in self.encodings.vocabularies and not pd.api.types.is_numeric_dtype(values):
+                values = self.encodings.encode(column, values.replace(ALIASES.get(column, {})))
+            encoded[column] = values
+        return pd.DataFrame(encoded).to_numpy(dtype='float64', na_value=-1)
+
+    def _score(self, matrix):
+        if self.workers <= 1 or len(matrix) < self.parallel_min_rows:
+            return self.model.predict_proba(matrix)[:, 1]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.path,))
+        chunks = np.array_split(matrix, self.workers)
+        return np.concatenate(list(self._pool.map(_score_chunk, chunks)))
+
+    def predict_proba(self, scenarios):
+        """Probability that each scenario's entity is present the following season."""
+        matrix = self.encode(scenarios)
+        # Row hashes: duplicates in the batch and rows seen before are scored once
+        keys = pd.util.hash_pandas_object(pd.DataFrame(matrix), index=False).to_numpy()
+        unique_keys, first_rows, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        probabilities = np.empty(len(unique_keys))
+        misses = []
+        for position, key in enumerate(unique_keys.tolist()):
+            cached = self.cache.get(key)
+            if cached is None:
+                misses.append(position)
+            else:
+                self.cache.move_to_end(key)
+                probabilities[position] = cached
+        self.cache_hits += len(unique_keys) - len(misses)
+
+        if misses:
+            misses = np.asarray(misses)
+            probabilities[misses] = self._score(matrix[first_rows[misses]])
+            for key, probability in zip(unique_keys[misses].tolist(), probabilities[misses].tolist()):
+                self.cache[key] = probability
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return probabilities[inverse.ravel()]
+
+    def predict(self, scenarios, threshold=0.5):
+        """The scenarios with probability and prediction columns added."""
+        scenarios = pd.DataFrame(scenarios).reset_index(drop=True)
+        probabilities = self.predict_proba(scenarios)
+        scenarios = scenarios.drop(columns=[TARGET], errors='ignore')
+        scenarios['probability'] = probabilities
+        scenarios['prediction'] = (probabilities >= threshold).astype('int8')
+        return scenarios
@@ -0,0 +1,19 @@
+# import libraries
+from .base_extractor import BaseDataExtractor
+from .collectors import collect_frame
+
+class RaceScheduleDataExtractor(BaseDataExtractor):
+    table_path = ('MRData', 'RaceTable', 'Races')
+    year_endpoint = "{year}.{format}"
+    year_column = None  # Races already carry their season
+
+    def save_data_to_csv(self, data, filename):
+        """Save the data to a CSV file."""
+        if not filename.endswith('.csv'):
+            filename = f"{filename}.csv"
+        data.to_csv(filename, index=False)
+        print(f"Data saved to: {filename}")
+    
+    def fetch_all_years_data(self, start_year=1950, end_year=2023):
+        # Collect every season's pages in a single pass
+        return collect_frame(self.iter_years_pages(start_year, end_year))
@@ -0,0 +1,225 @@
+# import libraries
+import os
+import shutil
+import logging
+from collections import namedtuple
+import pandas as pd
+from .base_extractor import BaseDataExtractor
+from .circuit_endpoint import CircuitDataExtractor
+from .constructors_endpoint import ConstructorsDataExtractor
+from .drivers_endpoint import DriversDataExtractor
+from .race_schedule_endpoint import RaceScheduleDataExtractor
+from .seasons_endpoint import SeasonsDataExtractor
+from .planner import MAX_PAGE_SIZE
+from .columnar import SCHEMAS, SEASON_COLUMNS, partition_path, season_parts, write_season
+
+logger = logging.getLogger(__name__)
+
+# Everything needed to crawl one Ergast endpoint:
+#   url          - per-season URL pattern ({season}, {format} and, for per-race endpoints, {round});
+#                  None if the endpoint is only served unfiltered
+#   all_url      - unfiltered URL pattern, or None
+#   table_path   - JSON path to the records
+#   record_path  - path inside each record to the nested rows (e.g. ['Results']), or None
+#   meta         - record fields copied onto every nested row
+#   season_column - column holding the season (added when the records do not carry it)
+#   schema       - column types, see columnar.SCHEMAS
+#   chunk_rows   - rows per chunk for heavy endpoints that are streamed to disk, or None
+EndpointSpec = namedtuple('EndpointSpec', [
+    'name', 'url', 'all_url', 'table_path', 'record_path', 'meta', 'season_column', 'schema', 'chunk_rows',
+])
+
+# Race fields kept on every nested row
+RACE_META = ['season', 'round', ['Circuit', 'circuitId']]
+
+def spec_from_extractor(name, extractor_class, all_url=None):
+    """Describe one of the hand-written extractors as an EndpointSpec."""
+    url = extractor_class.year_endpoint
+    if url is not None:
+        url = url.replace('{year}', '{season}')
+    return EndpointSpec(
+        name=name,
+        url=url,
+        all_url=all_url,
+        table_path=extractor_class.table_path,
+        record_path=None,
+        meta=None,
+        season_column=SEASON_COLUMNS[name],
+        schema=SCHEMAS[name],
+        chunk_rows=None,
+    )
+
+def nested_spec(name, url, record_path, meta=RACE_META, chunk_rows=100000):
+    """Describe a per-race endpoint whose rows are nested inside MRData.RaceTable.Races."""
+    return EndpointSpec(
+        name=name,
+        url=url,
+        all_url=None,
+        table_path=('MRData', 'RaceTable', 'Races'),
+        record_path=record_path,
+        meta=meta,
+        season_column=SEASON_COLUMNS[name],
+        schema=SCHEMAS[name],
+        chunk_rows=chunk_rows,
+    )
+
+ENDPOINTS = {
+    'circuits': spec_from_extractor('circuits', CircuitDataExtractor, 'circuits.{format}'),
+    'constructors': spec_from_extractor('constructors', ConstructorsDataExtractor, 'constructors.{format}'),
+    'drivers': spec_from_extractor('drivers', DriversDataExtractor, 'drivers.{format}'),
+    'races': spec_from_extractor('races', RaceScheduleDataExtractor, 'races.{format}'),
+    'seasons': spec_from_extractor('seasons', SeasonsDataExtractor, 'seasons.{format}'),
+    'results': nested_spec('results', '{season}/results.{format}', ['Results']),
+    'qualifying': nested_spec('qualifying', '{season}/qualifying.{format}', ['QualifyingResults']),
+    # Two-level record path: meta paths of length 2 are read from each lap, not the race
+    'laps': nested_spec('laps', '{season}/{round}/laps.{format}', ['Laps', 'Timings'],
+                        meta=['season', 'round', ['Laps', 'number']], chunk_rows=250000),
+    'pitstops': nested_spec('pitstops', '{season}/{round}/pitstops.{format}', ['PitStops']),
+}
+
+def register(spec):
+    """Add or replace an endpoint; its schema must also be listed in columnar.SCHEMAS to be written."""
+    ENDPOINTS[spec.name] = spec
+    return spec
+
+class SpecExtractor(BaseDataExtractor):
+    """Extractor driven by an EndpointSpec instead of a hand-written subclass."""
+    # Heavy per-race endpoints are crawled in the fewest round trips the API allows
+    page_limit = MAX_PAGE_SIZE
+
+    def __init__(self, spec, base_url, max_workers=1, cache=None, instrumentation=None, journal=None):
+        super().__init__(base_url, max_workers, cache, instrumentation, journal)
+        self.spec = spec
+        self.table_path = spec.table_path
+        if spec.url is not None and '{round}' not in spec.url:
+            self.year_endpoint = spec.url.replace('{season}', '{year}')
+        # Only add the season column when the records do not carry it themselves
+        self.year_column = None if spec.record_path or spec.season_column == 'season' else spec.season_column
+
+    def decode_page(self, response, format):
+        if self.spec.record_path and format != 'json':
+            raise ValueError(f"{self.spec.name} is only supported with the JSON API")
+        return super().decode_page(response, format)
+
+    def page_frame(self, page):
+        if not self.spec.record_path:
+            return super().page_frame(page)
+        # One row per nested record, with the race fields copied on
+        return pd.json_normalize(page.records, record_path=self.spec.record_path, meta=self.spec.meta,
+                                 errors='ignore')
+
+    def endpoint(self, season=None, round=None, format='json'):
+        if season is None:
+            return self.spec.all_url.format(format=format)
+        return self.spec.url.format(season=season, round=round, format=format)
+
+    def iter_season_pages(self, season, format='json', rounds=None):
+        """Yield the page DataFrames of one season, race by race for per-race endpoints."""
+        if self.spec.url is None:
+            raise ValueError(f"{self.spec.name} has no per-season endpoint")
+        if '{round}' not in self.spec.url:
+            endpoints = [self.endpoint(season, format=format)]
+        else:
+            endpoints = [self.endpoint(season, round, format) for round in (rounds or self.season_rounds(season, format))]
+        for endpoint in endpoints:
+            for page in self.iter_pages(endpoint, format):
+                if self.year_column is not None:
+                    page[self.year_column] = season
+                yield page
+
+    def season_rounds(self, season, format='json'):
+        """Rounds of a season, read from its race schedule."""
+        schedule = extractor_for('races', self.base_url, cache=self.cache, instrumentation=self.instrumentation,
+                                 journal=self.journal)
+        pages = schedule.iter_pages(schedule.endpoint(season, format=format), format)
+        rounds = sorted({int(round) for page in pages if 'round' in page for round in page['round']})
+        # A schedule that failed to fetch leaves the season incomplete too
+        self.failures += schedule.failures
+        return rounds
+
+def extractor_for(name, base_url, **kwargs):
+    return SpecExtractor(ENDPOINTS[name], base_url, **kwargs)
+
+class ChunkedIngestor:
+    """Stream an endpoint to season partitions in fixed-size chunks.
+
+    Page DataFrames are buffered only until chunk_rows rows are reached, then
+    written as root/<name>/season=YYYY/part-N.parquet and dropped, so memory
+    stays bounded by one chunk however many seasons are crawled. Chunks never
+    span seasons, and read_partitioned reads a season's parts back in order.
+
+    A season's chunks are staged under root/.staging and only replace its
+    stored parts once every page of the season was fetched; after a failed
+    fetch the previous parts are kept.
+    """
+
+    def __init__(self, extractor, root, chunk_rows=None, format='parquet'):
+        self.extractor = extractor
+        self.spec = extractor.spec
+        self.root = root
+        self.chunk_rows = chunk_rows or self.spec.chunk_rows or 100000
+        self.format = format
+        self.staging_root = os.path.join(root, '.staging')
+
+    def ingest_season(self, season, api_format='json', rounds=None):
+        """Write one season's chunks, replacing any previous ones; returns the rows written.
+
+        Returns None, leaving the stored season untouched, if any page failed to fetch.
+        """
+        # Chunks left by an interrupted run
+        shutil.rmtree(self._staging_dir(season), ignore_errors=True)
+        failures = self.extractor.failures
+        buffer, buffered, part, rows = [], 0, 0, 0
+        for page in self.extractor.iter_season_pages(season, api_format, rounds):
+            if page.empty:
+                continue
+            buffer.append(page)
+            buffered += len(page)
+            while buffered >= self.chunk_rows:
+                chunk = pd.concat(buffer, ignore_index=True)
+                self._write(chunk.iloc[:self.chunk_rows], season, part)
+                part += 1
+                rows += self.chunk_rows
+                buffer = [chunk.iloc[self.chunk_rows:].copy()]
+                buffered -= self.chunk_rows
+        if buffered:
+            self._write(pd.concat(buffer, ignore_index=True), season, part)
+            part += 1
+            rows += buffered
+        if self.extractor.failures > failures:
+            shutil.rmtree(self._staging_dir(season), ignore_errors=True)
+            logger.warning("Failed to fetch %s %s, keeping its previous parts", self.spec.name, season)
+            return None
+        self._swap_in(season, part)
+        logger.info("Ingested %s rows of %s %s", rows, self.spec.name, season)
+        return rows
+
+    def ingest(self, start_year, end_year, api_format='json'):
+        """Ingest every season in the range; returns {season: rows} for the seasons stored."""
+        rows = {}
+        for season in range(start_year, end_year + 1):
+            season_rows = self.ingest_season(season, api_format)
+            if season_rows is not None:
+                rows[season] = season_rows
+        return rows
+
+    def stored_parts(self, season):
+        return season_parts(self.root, self.spec.name, season, self.format)
+
+    def _staging_dir(self, season):
+        return os.path.dirname(partition_path(self.staging_root, self.spec.name, season, self.format))
+
+    def _write(self, chunk, season, part):
+        write_season(chunk, self.spec.name, season, self.staging_root, self.format, part)
+
+    def _swap_in(self, season, parts):
+        """Move the staged chunks over the stored ones and drop the parts beyond them."""
+        stale_parts = self.stored_parts(season)[parts:]
+        for part in range(parts):
+            path = partition_path(self.root, self.spec.name, season, self.format, part)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(partition_path(self.staging_root, self.spec.name, season, self.format, part), path)
+        # Parts left over from an earlier, larger crawl of the season
+        for stale_part in stale_parts:
+            os.remove(stale_part)
+        shutil.rmtree(self._staging_dir(season), ignore_errors=True)
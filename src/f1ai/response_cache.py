@@ -0,0 +1,151 @@
+# import libraries
+import os
+import re
+import json
+import time
+import hashlib
+import datetime
+import threading
+import requests
+
+class CacheMissError(Exception):
+    """Raised in offline mode when a request is not in the cache."""
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response rebuilt from a cache entry."""
+    from_cache = True
+
+    def __init__(self, url, status_code, content, headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+def season_ttl(endpoint, current_ttl=3600):
+    """Return the TTL in seconds for an endpoint, or None to keep it forever.
+
+    Endpoints scoped to a finished season (e.g. "1987/drivers.json" or
+    "1987.json") never change, so they are cached forever. Everything else,
+    including the current season and unfiltered tables, expires after
+    current_ttl seconds.
+    """
+    match = re.match(r'(\d{4})(?:[/.]|$)', endpoint or '')
+    if match and int(match.group(1)) < datetime.date.today().year:
+        return None
+    return current_ttl
+
+class ResponseCache:
+    """On-disk HTTP response cache keyed by URL and query parameters."""
+
+    def __init__(self, cache_dir, ttl=season_ttl, max_bytes=512 * 1024 * 1024, offline=False):
+        self.cache_dir = cache_dir
+        # Either a number of seconds, None (forever) or a callable taking the endpoint
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # In offline mode every request must be served from disk, stale or not
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._size = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, url, params=None):
+        """Hash the URL and its sorted query parameters into a cache key."""
+        query = '&'.join(f"{name}={value}" for name, value in sorted((params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode('utf-8')).hexdigest()
+
+    def get(self, url, params=None):
+        """Return the cached response, or None if it is missing or expired."""
+        path = self._path(self.key(url, params))
+        try:
+            with open(path, 'rb') as entry:
+                meta = json.loads(entry.readline())
+                content = entry.read()
+        except (FileNotFoundError, ValueError):
+            return None
+
+        expires_at = meta.get('expires_at')
+        if not self.offline and expires_at is not None and expires_at < time.time():
+            return None
+
+        # Touch the entry so eviction drops the least recently used pages first
+        os.utime(path)
+        return CachedResponse(meta['url'], meta['status_code'], content, meta.get('headers'))
+
+    def put(self, url, response, params=None, endpoint=None):
+        """Store a successful response on disk."""
+        if response.status_code != 200:
+            return
+        ttl = self.ttl(endpoint) if callable(self.ttl) else self.ttl
+        meta = {
+            'url': url,
+            'params': params or {},
+            'status_code': response.status_code,
+            'headers': {'Content-Type': response.headers.get('Content-Type', '')},
+            'stored_at': time.time(),
+            'expires_at': None if ttl is None else time.time() + ttl,
+        }
+        path = self._path(self.key(url, params))
+        # Overwriting an expired entry replaces its bytes rather than adding to them
+        try:
+            replaced_size = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced_size = 0
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as entry:
+            entry.write(json.dumps(meta).encode('utf-8') + b'\n')
+            entry.write(response.content)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_size()
+            else:
+                self._size += os.path.getsize(path) - replaced_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def fetch(self, url, params=None, headers=None, endpoint=None, timeout=30):
+        """Serve a request from the cache, falling back to the network on a miss."""
+        cached = self.get(url, params)
+        if cached is not None:
+            return cached
+        if self.offline:
+            raise CacheMissError(f"Not in cache (offline mode): {url} {params or ''}")
+        response = requests.get(url, params=params, headers=headers, timeout=timeout)
+        self.put(url, response, params, endpoint)
+        return response
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self._lock:
+            for path in self._entries():
+                os.remove(path)
+            self._size = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.entry")
+
+    def _entries(self):
+        return [entry.path for entry in os.scandir(self.cache_dir) if entry.name.endswith('.entry')]
+
+    def _disk_size(self):
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def _evict(self):
+        """Drop the least recently used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries(), key=os.path.getmtime)
+        size = self._disk_size()
+        for path in entries:
+            if size <= self.max_bytes:
+                break
+            size -= os.path.getsize(path)
+            os.remove(path)
+        self._size = size
@@ -0,0 +1,12 @@
+# import libraries
+from .base_extractor import BaseDataExtractor
+
+class SeasonsDataExtractor(BaseDataExtractor):
+    table_path = ('MRData', 'SeasonTable', 'Seasons')
+
+    def save_data_to_csv(self, data, filename):
+        """Save the data to a CSV file."""
+        if not filename.endswith('.csv'):
+            filename += '.csv'
+        data.to_csv(filename, index=False)
+        print(f"Data saved to {filename}")
@@ -0,0 +1,170 @@
+# import libraries
+import os
+import hashlib
+import logging
+from .columnar import partition_path, read_partitioned, season_parts, stored_seasons
+from .incremental import Manifest
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a view definition changes; every stored season is then rebuilt
+VIEW_VERSION = 2
+
+def race_circuits(inputs):
+    """season x round x circuit: the race schedule with each race's circuit attributes.
+
+    Circuit attributes come from the circuits table of the same season when it
+    is available, otherwise from the circuit embedded in the race. The race
+    keeps its own url; the circuit's is circuitUrl.
+    """
+    races = inputs['races']
+    view = races[[column for column in races.columns if not column.startswith('Circuit.')]].copy()
+    for column in races.columns:
+        if column.startswith('Circuit.'):
+            name = column[len('Circuit.'):]
+            view['circuitUrl' if name == 'url' else name] = races[column].to_numpy()
+    circuits = inputs.get('circuits')
+    if circuits is not None and not circuits.empty:
+        circuits = circuits.drop(columns=['Year'], errors='ignore').rename(columns={'url': 'circuitUrl'})
+        circuits = circuits.drop_duplicates('circuitId')
+        attributes = view[['circuitId']].merge(circuits, on='circuitId', how='left')
+        for column in attributes.columns.drop('circuitId'):
+            embedded = view[column] if column in view.columns else None
+            view[column] = attributes[column].to_numpy() if embedded is None else attributes[column].fillna(embedded).to_numpy()
+    view['circuitId'] = view['circuitId'].astype('category')
+    return view.sort_values(['season', 'round']).reset_index(drop=True)
+
+def driver_constructors(inputs):
+    """season x driver x constructor, derived from the race results of the season.
+
+    One row per driver and team they raced for, with their results for that
+    team and the driver and constructor attributes of the season.
+    """
+    results = inputs['results']
+    results = results.assign(
+        win=results['position'] == 1,
+        podium=results['position'] <= 3,
+    )
+    view = results.groupby(['season', 'Driver.driverId', 'Constructor.constructorId'], observed=True).agg(
+        races=('round', 'nunique'),
+        first_round=('round', 'min'),
+        last_round=('round', 'max'),
+        points=('points', 'sum'),
+        wins=('win', 'sum'),
+        podiums=('podium', 'sum'),
+        best_position=('position', 'min'),
+    ).reset_index().rename(columns={'Driver.driverId': 'driverId', 'Constructor.constructorId': 'constructorId'})
+    view['driverId'] = view['driverId'].astype(str)
+    view['constructorId'] = view['constructorId'].astype(str)
+
+    drivers = inputs.get('drivers')
+    if drivers is not None and not drivers.empty:
+        drivers = drivers.drop(columns=['year', 'url'], errors='ignore').drop_duplicates('driverId')
+        view = view.merge(drivers.astype({'driverId': str}), on='driverId', how='left')
+    constructors = inputs.get('constructors')
+    if constructors is not None and not constructors.empty:
+        constructors = constructors.drop(columns=['year', 'url'], errors='ignore').drop_duplicates('constructorId')
+        constructors = constructors.rename(columns={'name': 'constructorName', 'nationality': 'constructorNationality'})
+        view = view.merge(constructors.astype({'constructorId': str}), on='constructorId', how='left')
+    view['driverId'] = view['driverId'].astype('category')
+    view['constructorId'] = view['constructorId'].astype('category')
+    return view.sort_values(['season', 'driverId', 'constructorId']).reset_index(drop=True)
+
+# View name -> (input tables, the first of which is required, and the function building one season)
+VIEWS = {
+    'race_circuits': (['races', 'circuits'], race_circuits),
+    'driver_constructors': (['results', 'drivers', 'constructors'], driver_constructors),
+}
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as partition_file:
+        for block in iter(lambda: partition_file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ViewStore:
+    """Joined views built per season from the columnar season partitions.
+
+    Inputs are read from source_root (as written by `f1ai fetch --format
+    parquet` and `f1ai ingest`); each view season is stored as
+    root/<view>/season=YYYY/part-0.parquet. The manifest keeps a fingerprint
+    of the input partitions every view season was built from, so refresh()
+    only rebuilds the seasons whose inputs changed.
+    """
+
+    def __init__(self, source_root='data/columnar', root='data/views'):
+        self.source_root = source_root
+        self.root = root
+        self.manifest = Manifest(os.path.join(root, 'manifest.json'))
+
+    def fingerprint(self, view, season):
+        """Hash of the view definition and the contents of every input partition of the season."""
+        inputs, _ = VIEWS[view]
+        fingerprint = hashlib.sha256(f"{view}:{VIEW_VERSION}".encode())
+        for name in inputs:
+            parts = season_parts(self.source_root, name, season)
+            fingerprint.update(f"{name}:{len(parts)}".encode())
+            for path in parts:
+                fingerprint.update(file_digest(path).encode())
+        return fingerprint.hexdigest()
+
+    def seasons(self, view):
+        """Seasons the view can be built for: those of its required input."""
+        return stored_seasons(VIEWS[view][0][0], self.source_root)
+
+    def stale_seasons(self, view, seasons=None):
+        seasons = self.seasons(view) if seasons is None else seasons
+        return [season for season in seasons if not self._is_current(view, season, self.fingerprint(view, season))]
+
+    def _is_current(self, view, season, fingerprint):
+        entry = self.manifest.get(view, season)
+        return (entry is not None and entry.get('fingerprint') == fingerprint
+                and os.path.exists(partition_path(self.root, view, season)))
+
+    def build_season(self, view, season):
+        """Build and store one season of a view; returns its row count."""
+        inputs, build = VIEWS[view]
+        frames = {}
+        for name in inputs:
+            if season_parts(self.source_root, name, season):
+                frames[name] = read_partitioned(name, self.source_root, seasons=[season])
+        data = build(frames)
+        path = partition_path(self.root, view, season)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data.to_parquet(f"{path}.tmp", index=False)
+        os.replace(f"{path}.tmp", path)
+        return len(data)
+
+    def refresh(self, views=None, seasons=None):
+        """Rebuild the stale seasons of each view; returns {view: seasons rebuilt}."""
+        rebuilt = {}
+        for view in views or VIEWS:
+            available = self.seasons(view)
+            if seasons is not None:
+                available = [season for season in available if season in set(seasons)]
+            rebuilt[view] = []
+            for season in available:
+                fingerprint = self.fingerprint(view, season)
+                if self._is_current(view, season, fingerprint):
+                    continue
+                rows = self.build_season(view, season)
+                self.manifest.mark_complete(view, season, rows, fingerprint=fingerprint, view_version=VIEW_VERSION)
+                rebuilt[view].append(season)
+            self._drop_removed(view, available if seasons is None else None)
+            self.manifest.save()
+            logger.info("Rebuilt %s season(s) of %s", len(rebuilt[view]), view)
+        return rebuilt
+
+    def _drop_removed(self, view, available):
+        """Delete view seasons whose required input partition no longer exists."""
+        if available is None:
+            return
+        for season in stored_seasons(view, self.root):
+            if season not in available:
+                os.remove(partition_path(self.root, view, season))
+                self.manifest.remove(view, season)
+
+    def load(self, view, seasons=None, columns=None):
+        """Read a view, touching only the requested seasons and columns."""
+        return read_partitioned(view, self.root, seasons=seasons, columns=columns)